@@ -1,5 +1,11 @@
-from aws_cdk import App
-from stack import ZerdeTelegramBotStack
+import os
+
+# Must be set before aws_cdk (and its jsii runtime) is imported: capturing a stack trace for
+# every construct is a large share of synth time. setdefault keeps an explicit export in charge.
+os.environ.setdefault("CDK_DISABLE_STACK_TRACE", "1")
+
+from aws_cdk import App  # noqa: E402
+from stack import ZerdeTelegramBotStack  # noqa: E402
 
 app = App()
 
@@ -12,7 +12,8 @@ from aws_cdk import aws_lambda_event_sources as lambda_event_sources
 from aws_cdk import aws_logs as logs
 from aws_cdk import aws_sqs as sqs
 from aws_cdk.aws_lambda_python_alpha import PythonFunction
-from components.constants import CONSTRUCT_PREFIX, LAMBDA_RUNTIME, PROJECT_ROOT, RESOURCE_PREFIX
+from components.bundling import python_bundling
+from components.constants import CONSTRUCT_PREFIX, LAMBDA_ARCHITECTURE, LAMBDA_RUNTIME, PROJECT_ROOT, RESOURCE_PREFIX
 from constructs import Construct
 
 
@@ -111,8 +112,9 @@ class BotConstruct(Construct):
             index="main.py",
             handler="lambda_handler",
             runtime=LAMBDA_RUNTIME,
-            architecture=_lambda.Architecture.ARM_64,
+            architecture=LAMBDA_ARCHITECTURE,
             layers=[shared_layer],
+            bundling=python_bundling(),
             timeout=Duration.seconds(90),
             memory_size=1024,
             log_group=logs.LogGroup(
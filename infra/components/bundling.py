@@ -0,0 +1,30 @@
+"""Shared Docker bundling options for ``PythonFunction`` / ``PythonLayerVersion`` assets."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from aws_cdk import DockerVolume
+from aws_cdk.aws_lambda_python_alpha import BundlingOptions
+from components.constants import ASSET_EXCLUDES
+
+# Host pip cache mounted into every bundling container, so repeat synths install wheels from disk.
+# CDK runs the container as the host uid (no writable $HOME), hence an explicit PIP_CACHE_DIR.
+PIP_CACHE_HOST_DIR = Path(os.environ.get("PIP_CACHE_DIR") or Path.home() / ".cache" / "pip")
+_PIP_CACHE_CONTAINER_DIR = "/tmp/pip-cache"
+
+
+def python_bundling() -> BundlingOptions:
+    """Asset excludes + persistent pip cache; does not affect the (source-based) asset hash."""
+    PIP_CACHE_HOST_DIR.mkdir(parents=True, exist_ok=True)
+    return BundlingOptions(
+        asset_excludes=ASSET_EXCLUDES,
+        environment={"PIP_CACHE_DIR": _PIP_CACHE_CONTAINER_DIR},
+        volumes=[
+            DockerVolume(
+                host_path=str(PIP_CACHE_HOST_DIR),
+                container_path=_PIP_CACHE_CONTAINER_DIR,
+            )
+        ],
+    )
@@ -5,6 +5,11 @@ from aws_cdk import aws_lambda as _lambda
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 
 LAMBDA_RUNTIME = _lambda.Runtime.PYTHON_3_13
+# Graviton for every function and the shared layer; PythonFunction bundles wheels for this platform.
+LAMBDA_ARCHITECTURE = _lambda.Architecture.ARM_64
 
 CONSTRUCT_PREFIX = "ZerdeServerless"
 RESOURCE_PREFIX = "zerde-serverless"
+
+# Local dev artefacts kept out of Lambda/layer assets (basename patterns: valid for rsync and CDK globs).
+ASSET_EXCLUDES = ["__pycache__", "*.pyc", ".pytest_cache", "tests", ".env*"]
@@ -7,7 +7,8 @@ from aws_cdk import aws_iam as iam
 from aws_cdk import aws_lambda as _lambda
 from aws_cdk import aws_logs as logs
 from aws_cdk.aws_lambda_python_alpha import PythonFunction
-from components.constants import CONSTRUCT_PREFIX, LAMBDA_RUNTIME, PROJECT_ROOT, RESOURCE_PREFIX
+from components.bundling import python_bundling
+from components.constants import CONSTRUCT_PREFIX, LAMBDA_ARCHITECTURE, LAMBDA_RUNTIME, PROJECT_ROOT, RESOURCE_PREFIX
 from constructs import Construct
 
 # Language → list of (hour_utc, minute_utc) trigger times
@@ -27,6 +28,7 @@ class NewsConstruct(Construct):
         construct_id: str,
         *,
         shared_layer: _lambda.ILayer,
+        genai_layer: _lambda.ILayer,
         env_name: str,
         is_prod: bool,
         ssm_secret_prefix: str,
@@ -48,8 +50,9 @@ class NewsConstruct(Construct):
             index="main.py",
             handler="lambda_handler",
             runtime=LAMBDA_RUNTIME,
-            architecture=_lambda.Architecture.ARM_64,
-            layers=[shared_layer],
+            architecture=LAMBDA_ARCHITECTURE,
+            layers=[shared_layer, genai_layer],
+            bundling=python_bundling(),
             timeout=Duration.minutes(5),
             memory_size=512,
             log_group=logs.LogGroup(
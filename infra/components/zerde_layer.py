@@ -1,9 +1,11 @@
-"""Shared Python Lambda layer (``/opt/python/zerde_common``)."""
+"""Shared Python Lambda layers: ``zerde_common`` code and third-party dependencies."""
 
 from __future__ import annotations
 
 from aws_cdk import aws_lambda as _lambda
-from components.constants import LAMBDA_RUNTIME, PROJECT_ROOT
+from aws_cdk.aws_lambda_python_alpha import PythonLayerVersion
+from components.bundling import python_bundling
+from components.constants import ASSET_EXCLUDES, LAMBDA_ARCHITECTURE, LAMBDA_RUNTIME, PROJECT_ROOT
 from constructs import Construct
 
 
@@ -15,8 +17,24 @@ def add_zerde_common_layer(
     return _lambda.LayerVersion(
         scope,
         construct_id,
-        code=_lambda.Code.from_asset(str(PROJECT_ROOT / "src" / "shared")),
+        code=_lambda.Code.from_asset(str(PROJECT_ROOT / "src" / "shared"), exclude=ASSET_EXCLUDES),
         layer_version_name="zerde-common",
         compatible_runtimes=[LAMBDA_RUNTIME],
-        compatible_architectures=[_lambda.Architecture.ARM_64],
+        compatible_architectures=[LAMBDA_ARCHITECTURE],
+    )
+
+
+def add_genai_deps_layer(
+    scope: Construct,
+    construct_id: str = "GenaiDepsLayer",
+) -> _lambda.ILayer:
+    """``google-genai`` (+ pydantic, httpx) from ``src/layers/genai``: pip-installed once, shared by news and quiz."""
+    return PythonLayerVersion(
+        scope,
+        construct_id,
+        entry=str(PROJECT_ROOT / "src" / "layers" / "genai"),
+        layer_version_name="zerde-genai-deps",
+        compatible_runtimes=[LAMBDA_RUNTIME],
+        compatible_architectures=[LAMBDA_ARCHITECTURE],
+        bundling=python_bundling(),
     )
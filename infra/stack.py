@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import os
 from pathlib import Path
 from typing import Any
@@ -11,10 +12,18 @@ from components.observability import (
     add_lambda_operational_alarms,
     add_sqs_dlq_visible_alarm,
 )
-from components.zerde_layer import add_zerde_common_layer
+from components.zerde_layer import add_genai_deps_layer, add_zerde_common_layer
 from constructs import Construct
 from dotenv import load_dotenv
 
+_DOTENV_PATH = Path(__file__).parent.parent / ".env"
+
+
+@functools.lru_cache(maxsize=None)
+def _load_dotenv_cached(path: Path, mtime: float | None) -> None:
+    """Parse ``.env`` once per (path, mtime): extra stacks in the same synth skip the re-read."""
+    load_dotenv(dotenv_path=path)
+
 
 class ZerdeTelegramBotStack(Stack):
     """CDK stack: wires together Messaging, Bot, and News constructs."""
@@ -25,8 +34,7 @@ class ZerdeTelegramBotStack(Stack):
         is_prod = env_name == "prod"
         log_level = "INFO" if is_prod else "DEBUG"
 
-        project_root = Path(__file__).parent.parent
-        load_dotenv(dotenv_path=project_root / ".env")
+        _load_dotenv_cached(_DOTENV_PATH, _DOTENV_PATH.stat().st_mtime if _DOTENV_PATH.exists() else None)
 
         def _parse_chat_ids(key: str) -> list[str]:
             value = os.environ.get(key, "")
@@ -96,6 +104,7 @@ class ZerdeTelegramBotStack(Stack):
 
         # ── Constructs ─────────────────────────────────────────────────────────
         zerde_layer = add_zerde_common_layer(self, f"{CONSTRUCT_PREFIX}ZerdeCommonLayer")
+        genai_layer = add_genai_deps_layer(self, f"{CONSTRUCT_PREFIX}GenaiDepsLayer")
 
         messaging = MessagingConstruct(
             self,
@@ -135,6 +144,7 @@ class ZerdeTelegramBotStack(Stack):
             self,
             f"{CONSTRUCT_PREFIX}News",
             shared_layer=zerde_layer,
+            genai_layer=genai_layer,
             env_name=env_name,
             is_prod=is_prod,
             ssm_secret_prefix=ssm_secret_prefix,
@@ -149,6 +159,7 @@ class ZerdeTelegramBotStack(Stack):
             self,
             f"{CONSTRUCT_PREFIX}Quiz",
             shared_layer=zerde_layer,
+            genai_layer=genai_layer,
             env_name=env_name,
             is_prod=is_prod,
             log_level=log_level,
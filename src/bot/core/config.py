@@ -1,6 +1,7 @@
 """Centralised configuration: environment variables and constants."""
 
 import os
+from functools import cache
 from typing import Any
 
 from zerde_common.config import require, require_int, require_json
@@ -22,34 +23,41 @@ _LAZY_SECRET_ATTRS: frozenset[str] = frozenset(
 )
 
 
+# Secrets don't change within an execution environment: getters below resolve once, then return the cached value
+# (an exception, e.g. a missing BOT_TOKEN, isn't cached).
 def _load_secret(ssm_name: str, env_key: str) -> None:
     load_ssm_secrets_if_needed(_SSM_SECRET_PREFIX, {ssm_name: env_key})
 
 
+@cache
 def get_bot_token() -> str:
     """Return Telegram bot token, loading SSM secrets on first use."""
     _load_secret("bot-token", "BOT_TOKEN")
     return require("BOT_TOKEN")
 
 
+@cache
 def get_webhook_secret_token() -> str:
     """Return Telegram webhook secret token, loading SSM secrets on first use."""
     _load_secret("webhook-secret-token", "WEBHOOK_SECRET_TOKEN")
     return require("WEBHOOK_SECRET_TOKEN")
 
 
+@cache
 def get_groq_api_key() -> str | None:
     """Return optional Groq API key, loading SSM secrets on first use."""
     _load_secret("groq-api-key", "GROQ_API_KEY")
     return os.environ.get("GROQ_API_KEY")
 
 
+@cache
 def get_gemini_api_key() -> str | None:
     """Return optional Gemini API key, loading SSM secrets on first use."""
     _load_secret("gemini-api-key", "GEMINI_API_KEY")
     return os.environ.get("GEMINI_API_KEY")
 
 
+@cache
 def get_deepseek_api_key() -> str | None:
     """Return optional DeepSeek API key, loading SSM secrets on first use."""
     _load_secret("deepseek-api-key", "DEEPSEEK_API_KEY")
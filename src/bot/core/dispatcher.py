@@ -1,24 +1,33 @@
 """Event Dispatcher and Execution Context for Telegram updates."""
 
-from typing import Any, Callable
+from __future__ import annotations
+
+import re
+from typing import TYPE_CHECKING, Any, Callable
 
 from core.config import get_chat_lang
 from core.logger import LoggerAdapter, get_logger
 from core.utils import check_membership
-from services.repositories import (
-    CaptchaRepository,
-    LambdaInvoker,
-    QuizRepository,
-    SQSClient,
-    StatsRepository,
-    VoteRepository,
-)
-from services.telegram import TelegramClient
+
+if TYPE_CHECKING:
+    # Annotation-only: keeps core.dispatcher (and every handler importing Context) off the boto3 import path.
+    from services.repositories import (
+        CaptchaRepository,
+        LambdaInvoker,
+        QuizRepository,
+        SQSClient,
+        StatsRepository,
+        VoteRepository,
+    )
+    from services.telegram import TelegramClient
 
 logger = LoggerAdapter(get_logger(__name__), {})
 
 HandlerFunc = Callable[["Context"], None]
 
+# "/cmd@botname args" -> "/cmd": same key as text.split()[0].split("@")[0], without the throwaway lists.
+_COMMAND_KEY_RE = re.compile(r"/[^\s@]*")
+
 
 # ── Context ─────────────────────────────────────────────────────────────────
 
@@ -29,6 +38,23 @@ class Context:
     This is the main object passed to every command / callback handler.
     """
 
+    __slots__ = (
+        "_update",
+        "bot",
+        "stats_repo",
+        "sqs_repo",
+        "vote_repo",
+        "quiz_repo",
+        "lambda_invoker",
+        "captcha_repo",
+        "callback_query",
+        "message",
+        "user_data",
+        "callback_query_id",
+        "callback_data",
+        "_text",
+    )
+
     def __init__(
         self,
         update: dict[str, Any],
@@ -60,17 +86,24 @@ class Context:
             self.callback_data = ""
             self.message = update.get("message", {})
             self.user_data = self.message.get("from", {})
+        self._text: str | None = None
 
-        raw_text = (self.message.get("text") or "").strip()
-        caption = (self.message.get("caption") or "").strip()
-        if raw_text:
-            self.text = raw_text
-        elif caption.startswith("/"):
-            # Captioned commands (e.g. /start on a photo) route like normal text commands.
-            self.text = caption
-        else:
-            self.text = ""
-        self.reply_to_message = self.message.get("reply_to_message")
+    @property
+    def text(self) -> str:
+        """Stripped message text, or a ``/``-prefixed caption; computed on first access."""
+        if self._text is None:
+            raw_text = (self.message.get("text") or "").strip()
+            if raw_text:
+                self._text = raw_text
+            else:
+                caption = (self.message.get("caption") or "").strip()
+                # Captioned commands (e.g. /start on a photo) route like normal text commands.
+                self._text = caption if caption.startswith("/") else ""
+        return self._text
+
+    @property
+    def reply_to_message(self) -> dict[str, Any] | None:
+        return self.message.get("reply_to_message")
 
     @property
     def user_id(self) -> int | None:
@@ -159,6 +192,8 @@ class Dispatcher:
         self.captcha_repo = captcha_repo
 
         self.command_handlers: dict[str, HandlerFunc] = {}
+        # First character after "/" of every registered command: "/<anything else>" is rejected without a regex match.
+        self._command_initials: frozenset[str] = frozenset()
         self.new_chat_members_handler: HandlerFunc | None = None
         self.callback_query_handler: HandlerFunc | None = None
         self.poll_answer_handler: HandlerFunc | None = None
@@ -171,7 +206,8 @@ class Dispatcher:
         def decorator(func: HandlerFunc):
             clean_name = command_name.lstrip("/")
             self.command_handlers[f"/{clean_name}"] = func
-            logger.debug(f"Registered command handler: /{clean_name}")
+            self._command_initials = frozenset(key[1:2] for key in self.command_handlers)
+            logger.debug("Registered command handler", extra={"command": clean_name})
             return func
 
         return decorator
@@ -238,11 +274,15 @@ class Dispatcher:
             self.new_chat_members_handler(ctx)
             return
 
-        if ctx.text and ctx.text.startswith("/"):
-            command_key = ctx.text.split()[0].split("@")[0]
-            if command_key in self.command_handlers:
-                self.command_handlers[command_key](ctx)
-                logger.info(f"Dispatching to command handler: {command_key}")
+        text = ctx.text
+        if text.startswith("/"):
+            handler = None
+            if text[1:2] in self._command_initials:
+                command_key = _COMMAND_KEY_RE.match(text).group()
+                handler = self.command_handlers.get(command_key)
+            if handler is not None:
+                handler(ctx)
+                logger.info("Dispatching to command handler", extra={"command": command_key})
                 return
             # Keep command behavior consistent: unknown commands are ignored and
             # must not fall through into document auto-summary handling.
@@ -253,7 +293,7 @@ class Dispatcher:
             self.document_message_handler(ctx)
             return
 
-        if ctx.text and not ctx.text.startswith("/") and self.message_handler:
+        if text and self.message_handler:
             logger.info("Dispatching to message handler")
             self.message_handler(ctx)
             return
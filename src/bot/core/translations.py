@@ -1,5 +1,6 @@
 """Localised UI strings for the Telegram bot."""
 
+from functools import lru_cache
 from typing import Any
 
 from core.config import DEFAULT_LANG
@@ -80,10 +81,12 @@ TRANSLATIONS = {
         "voteban_usage": "❌ Usage: Reply to a message with /voteban to start voting to ban that user.",
         "voteban_self": "❌ You cannot vote to ban yourself.",
         "voteban_admin": "❌ You cannot vote to ban administrators.",
+        "voteban_in_progress": "⚠️ A vote to ban {TARGET} is already in progress.",
         "not_in_group": "❌ You are not in the group. This bot does not work outside of groups.",
         "voteban_initiated": ("🗳️ <b>Vote to Ban</b>\n\n" "👤 Initiated by: {INITIATOR}\n" "🎯 Target: {TARGET}"),
         "voteban_vote_recorded": "✅ Your vote has been recorded.",
         "voteban_already_voted": "⚠️ You have already voted on this ban.",
+        "voteban_closed": "⚠️ This vote has already ended.",
         "voteban_banned": (
             "⚖️ <b>User Banned by Vote</b>\n\n"
             "🎯 {TARGET} has been banned after receiving {VOTES_FOR} votes.\n\n"
@@ -248,12 +251,14 @@ TRANSLATIONS = {
         "voteban_usage": "❌ Қолданылуы: Қолданушыны бұғаттау үшін, оның хабарламасына жауап (reply) ретінде /voteban пәрменін жіберіңіз.",  # noqa: E501
         "voteban_self": "❌ Өзіңізді бұғаттауға дауыс бере алмайсыз.",
         "voteban_admin": "❌ Әкімшілерді (админдерді) бұғаттауға дауыс бере алмайсыз.",
+        "voteban_in_progress": "⚠️ {TARGET} қолданушысын бұғаттауға дауыс беру әлі жүріп жатыр.",
         "not_in_group": "❌ Сіз топ қосылған жоқсыз. Бұл бот топтан тыс мүшелер үшін қызмет көрсетпейді.",
         "voteban_initiated": (
             "🗳️ <b>Бұғаттауға дауыс беру</b>\n\n" "👤 Бастаған: {INITIATOR}\n" "🎯 Бұғатталатын қолданушы: {TARGET}"
         ),
         "voteban_vote_recorded": "✅ Сіздің дауысыңыз қабылданды.",
         "voteban_already_voted": "⚠️ Сіз бұл қолданушыны бұғаттауға дауыс беріп қойғансыз.",
+        "voteban_closed": "⚠️ Бұл дауыс беру аяқталып қойған.",
         "voteban_banned": (
             "⚖️ <b>Дауыс беру арқылы бұғаттау</b>\n\n"
             "🎯 {TARGET} қажетті {VOTES_FOR} дауыс жинап, топтан шығарылды.\n\n"
@@ -411,10 +416,12 @@ TRANSLATIONS = {
         "voteban_usage": "❌ 用法：回复某条消息并发送 /voteban，发起封禁投票。",
         "voteban_self": "❌ 你不能给自己投封禁票。",
         "voteban_admin": "❌ 你不能对管理员发起封禁投票。",
+        "voteban_in_progress": "⚠️ 针对 {TARGET} 的封禁投票正在进行中。",
         "not_in_group": "❌ 你不在该群组中。该机器人不支持群外使用。",
         "voteban_initiated": ("🗳️ <b>封禁投票</b>\n\n" "👤 发起人：{INITIATOR}\n" "🎯 目标：{TARGET}"),
         "voteban_vote_recorded": "✅ 你的投票已记录。",
         "voteban_already_voted": "⚠️ 你已参与过本次投票。",
+        "voteban_closed": "⚠️ 本次投票已结束。",
         "voteban_banned": (
             "⚖️ <b>用户已被投票封禁</b>\n\n"
             "🎯 {TARGET} 获得 {VOTES_FOR} 票后已被封禁。\n\n"
@@ -565,10 +572,12 @@ TRANSLATIONS = {
         ),
         "voteban_self": "❌ Нельзя голосовать за бан самого себя.",
         "voteban_admin": "❌ Нельзя голосовать за бан администраторов.",
+        "voteban_in_progress": "⚠️ Голосование за бан {TARGET} уже идёт.",
         "not_in_group": "❌ Вы не состоите в группе. Бот не работает вне групп.",
         "voteban_initiated": ("🗳️ <b>Голосование за бан</b>\n\n" "👤 Инициатор: {INITIATOR}\n" "🎯 Цель: {TARGET}"),
         "voteban_vote_recorded": "✅ Ваш голос учтен.",
         "voteban_already_voted": "⚠️ Вы уже голосовали в этом голосовании.",
+        "voteban_closed": "⚠️ Это голосование уже завершено.",
         "voteban_banned": (
             "⚖️ <b>Пользователь забанен голосованием</b>\n\n"
             "🎯 {TARGET} был забанен после {VOTES_FOR} голосов.\n\n"
@@ -659,14 +668,26 @@ TRANSLATIONS = {
 }
 
 
-def get_translated_text(key: str, lang_code: str = "kk", **kwargs: Any) -> str:
-    """Get translated text for *key*, falling back to DEFAULT_LANG."""
+def _render(key: str, lang_code: str, kwargs: dict[str, Any]) -> str:
     target_lang = lang_code if lang_code in TRANSLATIONS else DEFAULT_LANG
     text = TRANSLATIONS[target_lang].get(key, key)
 
     try:
-        text = text.format(**kwargs)
+        text = text.format_map(kwargs)  # kwargs is already a dict: no ** re-pack per call
     except KeyError as e:
-        logger.warning(f"Missing format key in translation: {e}")
+        logger.warning("Missing format key in translation", extra={"key": key, "missing": str(e)})
 
     return text
+
+
+@lru_cache(maxsize=512)
+def _render_static(key: str, lang_code: str) -> str:
+    """Placeholder-free messages (help, errors, buttons) repeat per update; render each (key, lang) once."""
+    return _render(key, lang_code, {})
+
+
+def get_translated_text(key: str, lang_code: str = "kk", **kwargs: Any) -> str:
+    """Get translated text for *key*, falling back to DEFAULT_LANG."""
+    if not kwargs:
+        return _render_static(key, lang_code)
+    return _render(key, lang_code, kwargs)
@@ -3,6 +3,9 @@
 from core.config import get_chat_lang
 from core.translations import get_translated_text
 
+# ChatMember statuses of someone still in the chat (Telegram sends them lowercase).
+_MEMBER_STATUSES = frozenset({"member", "restricted", "administrator", "creator"})
+
 
 def format_mention(user_id: int, username: str | None, first_name: str = "User") -> str:
     """Build a Telegram user mention (prefers @username when available)."""
@@ -13,10 +16,7 @@ def format_mention(user_id: int, username: str | None, first_name: str = "User")
 
 def check_membership(ctx) -> bool:
     member = ctx.bot.get_chat_member(ctx.chat_id, ctx.user_id)
-    if (
-        member.get("status") not in ("member", "restricted", "administrator", "creator")
-        or member.get("is_member") is False
-    ):
+    if member.get("status") not in _MEMBER_STATUSES or member.get("is_member") is False:
         if ctx.callback_query_id:
             ctx.bot.answer_callback_query(
                 ctx.callback_query_id,
@@ -6,6 +6,7 @@ from typing import Any
 from app import get_bot, get_captcha_repo, get_dispatcher
 from core.logger import LoggerAdapter, get_logger
 from services.sqs_task_router import process_sqs_event
+from services.telegram import drain_background
 from webhook import handle_event
 from zerde_common.logging_utils import api_gateway_event_summary
 
@@ -26,6 +27,7 @@ def lambda_handler(event: dict[str, Any], context: Any) -> dict[str, Any] | None
         try:
             process_sqs_event(event, get_bot(), get_captcha_repo())
         finally:
+            drain_background()
             elapsed_ms = int((time.monotonic() - started) * 1000)
             logger.info(
                 "Bot SQS batch finished",
@@ -40,4 +42,7 @@ def lambda_handler(event: dict[str, Any], context: Any) -> dict[str, Any] | None
     log_extra_api: dict = api_gateway_event_summary(event)
     log_extra_api["lambda_request_id"] = request_id
     logger.info("Bot Lambda handler called", extra=log_extra_api)
-    return handle_event(event, get_dispatcher(), get_bot())
+    try:
+        return handle_event(event, get_dispatcher(), get_bot())
+    finally:
+        drain_background()
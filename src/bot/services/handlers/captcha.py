@@ -1,6 +1,6 @@
 """Captcha verification: grid image challenge, answer checking, timeout kick."""
 
-import re
+from concurrent.futures import Future
 from typing import Any
 
 from core.config import CAPTCHA_MAX_ATTEMPTS, CAPTCHA_TIMEOUT_SECONDS
@@ -8,8 +8,7 @@ from core.dispatcher import Context
 from core.logger import LoggerAdapter, get_logger
 from core.translations import get_translated_text
 from core.utils import format_mention
-from services.captcha_image import generate_grid_captcha
-from services.telegram import TelegramClient
+from services.telegram import TelegramAPIError, TelegramClient, submit_background
 
 logger = LoggerAdapter(get_logger(__name__), {})
 
@@ -40,6 +39,15 @@ _TEXT_ONLY_PERMISSIONS: dict[str, bool] = {
     "can_add_web_page_previews": False,
 }
 
+# Without captcha state, a timed-out user is kicked only while still a plain (or restricted) member.
+_KICKABLE_STATUSES = frozenset({"restricted", "member"})
+
+# Telegram answers 400 (user not found / not a member) or 403 when the timed-out user is already gone.
+_EXPECTED_TIMEOUT_STATUSES = frozenset({400, 403})
+# A redelivered timeout task comes back after the queue's 3-minute visibility timeout (up to 3 receives);
+# the pending entry has to outlive that or the retry reads the user as already verified.
+_TIMEOUT_RETRY_TTL_SECONDS = 10 * 60
+
 
 def process_timeout_task(bot: TelegramClient, task_data: dict[str, Any]) -> None:
     """Process CHECK_TIMEOUT task: kick user if still restricted, clean up captcha state."""
@@ -52,6 +60,7 @@ def process_timeout_task(bot: TelegramClient, task_data: dict[str, Any]) -> None
     if not all([chat_id, user_id, join_message_id, verification_message_id]):
         logger.warning("Timeout task missing required fields", task_data=task_data)
         return
+    redeliver = False
     try:
         # Use DynamoDB state as source of truth: if no pending entry, user already verified
         if captcha_repo:
@@ -61,21 +70,33 @@ def process_timeout_task(bot: TelegramClient, task_data: dict[str, Any]) -> None
                 return
         else:
             member = bot.get_chat_member(chat_id, user_id)
-            status = (member.get("status") or "").lower()
-            if status not in ("restricted", "member"):
+            if member.get("status") not in _KICKABLE_STATUSES:
                 return
 
         logger.info("User %s timed out. Kicking.", user_id)
         bot.kick_chat_member(chat_id, user_id)
         try:
-            bot.delete_message(chat_id, join_message_id)
-            bot.delete_message(chat_id, verification_message_id)
+            bot.delete_messages(chat_id, [join_message_id, verification_message_id])
         except Exception as e:
             logger.warning("Failed to delete join/verification messages: %s", e)
+    except TelegramAPIError as e:
+        if e.status in _EXPECTED_TIMEOUT_STATUSES:
+            # The user left or the messages are already gone; no traceback for the common case.
+            logger.info("Timeout task skipped", extra={"user_id": user_id, "status": e.status, "body": e.body[:200]})
+        elif e.status == 429 or e.status >= 500:
+            # Still throttled/failing after the client's own retries: keep the pending state and let SQS redeliver
+            # (the queue's DLQ bounds the attempts) instead of dropping the kick.
+            redeliver = True
+            logger.warning("Timeout task deferred to SQS retry", extra={"user_id": user_id, "status": e.status})
+            if captcha_repo:
+                captcha_repo.extend_pending(chat_id, user_id, _TIMEOUT_RETRY_TTL_SECONDS)
+            raise
+        else:
+            logger.exception("Timeout task error: %s", e)
     except Exception as e:
         logger.exception("Timeout task error (user may have left or message deleted): %s", e)
     finally:
-        if captcha_repo:
+        if captcha_repo and not redeliver:
             try:
                 captcha_repo.delete_pending(chat_id, user_id)
             except Exception as e:
@@ -84,71 +105,131 @@ def process_timeout_task(bot: TelegramClient, task_data: dict[str, Any]) -> None
 
 def handle_new_member(ctx: Context) -> None:
     """Mute new members, send grid image captcha, save state, queue timeout."""
-    try:
-        members = ctx.message.get("new_chat_members", [])
-        for member in members:
-            if member.get("is_bot"):
-                continue
-
-            user_id = member.get("id")
-            ctx.bot.restrict_chat_member(ctx.chat_id, user_id, _TEXT_ONLY_PERMISSIONS)
-
-            image_bytes, expected = generate_grid_captcha()
-            mention = format_mention(user_id, member.get("username"), member.get("first_name", "User"))
-            caption = get_translated_text(
-                "captcha_image_challenge",
-                ctx.lang_code,
-                MENTION=mention,
-                TIMEOUT=CAPTCHA_TIMEOUT_SECONDS,
-            )
+    # Late import: Pillow is only needed when someone joins, keep it off the webhook cold start.
+    from services.captcha_image import generate_grid_captcha
 
+    # Several members can join in one update; their timeouts and join counts are flushed once.
+    pending_timeouts: list[dict[str, int]] = []
+    joins = 0
+    failed = False
+    try:
+        humans = [m for m in ctx.message.get("new_chat_members", []) if not m.get("is_bot")]
+        # Every mute is in flight at once (and while images render); each challenge waits only on its own.
+        mutes = [
+            submit_background(ctx.bot.restrict_chat_member, ctx.chat_id, m["id"], _TEXT_ONLY_PERMISSIONS)
+            for m in humans
+        ]
+        # Captcha photos go out concurrently too; pending state is still written here, on the handler thread.
+        challenges: list[tuple[dict[str, Any], str, Future]] = []
+        for member, muted in zip(humans, mutes):
             try:
-                sent_message = ctx.bot.send_photo(ctx.chat_id, image_bytes, caption=caption)
-            except Exception:
-                ctx.bot.restrict_chat_member(ctx.chat_id, user_id, _FULL_PERMISSIONS)
-                raise
-            msg_id = sent_message.get("message_id") if sent_message else None
-
-            if msg_id is not None:
-                if ctx.captcha_repo:
-                    ctx.captcha_repo.save_pending(
-                        ctx.chat_id,
-                        user_id,
-                        expected=expected,
-                        join_msg_id=ctx.message_id,
-                        verify_msg_id=msg_id,
-                    )
-
-                if ctx.sqs_repo:
-                    ctx.sqs_repo.send_timeout_task(
-                        ctx.chat_id,
-                        user_id,
-                        join_message_id=ctx.message_id,
-                        verification_message_id=msg_id,
-                        delay_seconds=CAPTCHA_TIMEOUT_SECONDS,
-                    )
-                    logger.info("Sent delayed timeout task", extra={"user_id": user_id})
-
-            if ctx.stats_repo:
-                ctx.stats_repo.increment_total_joins(ctx.chat_id)
-
+                image_bytes, expected = generate_grid_captcha()
+                sent = submit_background(
+                    _send_challenge, ctx.bot, ctx.chat_id, member, muted, image_bytes, _challenge_caption(ctx, member)
+                )
+                challenges.append((member, expected, sent))
+            except Exception as e:
+                failed = True
+                logger.exception("Captcha challenge failed", extra={"user_id": member["id"], "error": e})
+        for member, expected, sent in challenges:
+            try:
+                _record_challenge(ctx, member["id"], expected, sent.result(), pending_timeouts)
+                joins += 1
+            except Exception as e:
+                # One member's failure doesn't leave the rest of a join flood muted without a captcha.
+                failed = True
+                logger.exception("Captcha challenge failed", extra={"user_id": member["id"], "error": e})
     except Exception as e:
+        failed = True
         logger.exception(f"handle_new_member error: {e}")
-        if ctx.chat_id:
-            ctx.reply(get_translated_text("error_occurred", ctx.lang_code), ctx.message_id)
+    finally:
+        # Members challenged before a failure still need their timeout, so flush unconditionally.
+        _flush_new_member_side_effects(ctx, pending_timeouts, joins)
+    if failed and ctx.chat_id:
+        ctx.reply(get_translated_text("error_occurred", ctx.lang_code), ctx.message_id)
+
+
+def _challenge_caption(ctx: Context, member: dict[str, Any]) -> str:
+    mention = format_mention(member["id"], member.get("username"), member.get("first_name", "User"))
+    return get_translated_text(
+        "captcha_image_challenge",
+        ctx.lang_code,
+        MENTION=mention,
+        TIMEOUT=CAPTCHA_TIMEOUT_SECONDS,
+    )
+
+
+def _send_challenge(
+    bot: TelegramClient,
+    chat_id: int,
+    member: dict[str, Any],
+    muted: Future,
+    image_bytes: bytes,
+    caption: str,
+) -> dict[str, Any] | None:
+    """Send one member's captcha once their mute has landed (runs on the background executor).
+
+    Mutes are submitted before any challenge, so the mute this waits on is already running or done.
+    """
+    muted.result()
+    try:
+        return bot.send_photo(chat_id, image_bytes, caption=caption)
+    except Exception:
+        bot.restrict_chat_member(chat_id, member["id"], _FULL_PERMISSIONS)
+        raise
+
+
+def _record_challenge(
+    ctx: Context,
+    user_id: int,
+    expected: str,
+    sent_message: dict[str, Any] | None,
+    pending_timeouts: list[dict[str, int]],
+) -> None:
+    """Save the pending captcha state and queue its timeout."""
+    msg_id = sent_message.get("message_id") if sent_message else None
+    if msg_id is None:
+        return
+
+    if ctx.captcha_repo:
+        ctx.captcha_repo.save_pending(
+            ctx.chat_id,
+            user_id,
+            expected=expected,
+            join_msg_id=ctx.message_id,
+            verify_msg_id=msg_id,
+        )
+    pending_timeouts.append(
+        {
+            "chat_id": ctx.chat_id,
+            "user_id": user_id,
+            "join_message_id": ctx.message_id,
+            "verification_message_id": msg_id,
+        }
+    )
+
+
+def _flush_new_member_side_effects(ctx: Context, pending_timeouts: list[dict[str, int]], joins: int) -> None:
+    if pending_timeouts and ctx.sqs_repo:
+        try:
+            ctx.sqs_repo.send_timeout_tasks(pending_timeouts, delay_seconds=CAPTCHA_TIMEOUT_SECONDS)
+            logger.info(
+                "Sent delayed timeout tasks",
+                extra={"user_ids": [t["user_id"] for t in pending_timeouts]},
+            )
+        except Exception as e:
+            logger.exception(f"Failed to queue captcha timeouts: {e}")
+    if joins and ctx.stats_repo:
+        ctx.stats_repo.increment_total_joins(ctx.chat_id, joins)
 
 
 def _delete_all_captcha_messages(ctx: Context, pending: dict, extra_ids: list[int] | None = None) -> None:
-    """Delete join message, captcha image, all error messages, and any extra IDs."""
+    """Delete join message, captcha image, all error messages, and any extra IDs (in the background)."""
     ids_to_delete = [pending["join_msg_id"], pending["verify_msg_id"]]
     ids_to_delete += pending.get("wrong_msg_ids", [])
     if extra_ids:
         ids_to_delete += extra_ids
-    for msg_id in ids_to_delete:
-        try:
-            ctx.bot.delete_message(ctx.chat_id, msg_id)
-        except Exception:
-            pass
+    ctx.bot.delete_messages_async(ctx.chat_id, ids_to_delete)
 
 
 def handle_captcha_answer(ctx: Context) -> None:
@@ -163,12 +244,9 @@ def handle_captcha_answer(ctx: Context) -> None:
     expected = pending["expected"]
     answer = ctx.text.strip()
 
-    # Delete any non-digit message silently (letters, emoji, mixed, etc.)
-    if not re.match(rf"^\d{{{len(expected)}}}$", answer):
-        try:
-            ctx.bot.delete_message(ctx.chat_id, ctx.message_id)
-        except Exception:
-            pass
+    # Delete any non-digit message silently (letters, emoji, mixed, etc.); nothing waits on the result.
+    if len(answer) != len(expected) or not answer.isdecimal():
+        ctx.bot.delete_message_async(ctx.chat_id, ctx.message_id)
         return
 
     if answer == expected:
@@ -176,13 +254,10 @@ def handle_captcha_answer(ctx: Context) -> None:
         ctx.bot.restrict_chat_member(ctx.chat_id, ctx.user_id, _FULL_PERMISSIONS)
         ctx.captcha_repo.delete_pending(ctx.chat_id, ctx.user_id)
 
-        # Delete captcha image, wrong-answer messages, and user's answer — keep system join message
+        # Delete captcha image, wrong-answer messages, and user's answer — keep system join message.
+        # Best-effort, so it runs in the background while the pending state and stat are written.
         ids_to_delete = [pending["verify_msg_id"], ctx.message_id] + pending.get("wrong_msg_ids", [])
-        for msg_id in ids_to_delete:
-            try:
-                ctx.bot.delete_message(ctx.chat_id, msg_id)
-            except Exception:
-                pass
+        ctx.bot.delete_messages_async(ctx.chat_id, ids_to_delete)
 
         if ctx.stats_repo:
             ctx.stats_repo.increment_verified_users(ctx.chat_id)
@@ -194,19 +269,17 @@ def handle_captcha_answer(ctx: Context) -> None:
         new_attempts = ctx.captcha_repo.increment_attempts(ctx.chat_id, ctx.user_id)
         remaining = CAPTCHA_MAX_ATTEMPTS - new_attempts
 
-        # Delete the user's wrong-answer message immediately
-        try:
-            ctx.bot.delete_message(ctx.chat_id, ctx.message_id)
-        except Exception:
-            pass
-
         if remaining <= 0:
             # Kick silently — no notification message (kicked user won't see it anyway)
             ctx.captcha_repo.delete_pending(ctx.chat_id, ctx.user_id)
-            _delete_all_captcha_messages(ctx, pending)
+            # The user's last wrong answer goes out in the same deleteMessages call as the captcha messages.
+            _delete_all_captcha_messages(ctx, pending, extra_ids=[ctx.message_id])
             ctx.bot.kick_chat_member(ctx.chat_id, ctx.user_id)
             logger.info("User %s kicked after %d wrong captcha attempts.", ctx.user_id, new_attempts)
         else:
+            # Delete the user's wrong-answer message in the background while the retry prompt is sent
+            ctx.bot.delete_message_async(ctx.chat_id, ctx.message_id)
+
             error_msg = ctx.reply(
                 get_translated_text("captcha_wrong_answer", ctx.lang_code, ATTEMPTS_LEFT=remaining),
                 reply_to_message_id=pending["verify_msg_id"],
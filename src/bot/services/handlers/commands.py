@@ -1,5 +1,7 @@
 """Simple bot commands: /start, /help, /support, /ping, /stats, /genquiz."""
 
+from bisect import bisect_right
+
 from core.config import (
     ADMIN_USER_ID,
     QUIZ_LAMBDA_NAME,
@@ -11,9 +13,14 @@ from core.dispatcher import Context
 from core.logger import LoggerAdapter, get_logger
 from core.translations import get_translated_text
 from services.handlers.quiz import react_genquiz_processing
+from services.spam.chat_member import is_chat_admin_or_creator
 
 logger = LoggerAdapter(get_logger(__name__), {})
 
+# /stats activity tiers by verified share (%): below 30 low, below 70 medium, otherwise high.
+_ACTIVITY_THRESHOLDS = (30, 70)
+_ACTIVITY_KEYS = ("activity_low", "activity_medium", "activity_high")
+
 
 def _parse_genquiz_args(text: str, chat_id: int | str) -> tuple[str, str, str] | None:
     """Parse ``/genquiz`` args: ``topic`` [, ``difficulty`` [, ``lang``]].
@@ -21,10 +28,11 @@ def _parse_genquiz_args(text: str, chat_id: int | str) -> tuple[str, str, str] |
     Order is fixed: topic (words), then optional difficulty, then optional lang.
     Defaults: difficulty ``medium``, lang from ``CHAT_LANG_MAP`` / ``DEFAULT_LANG``.
     """
-    parts = text.split()
+    parts = text.split(maxsplit=1)
     if len(parts) < 2:
         return None
-    tokens = parts[1:]
+    # Only the last two words can be difficulty / lang, so the topic words are never split apart.
+    tokens = parts[1].rsplit(maxsplit=2)
     if len(tokens) == 1:
         return (tokens[0], "medium", get_chat_lang(chat_id))
 
@@ -70,9 +78,7 @@ def handle_ping(ctx: Context) -> None:
 def handle_stats(ctx: Context) -> None:
     """Admin-only: reply with group statistics."""
     try:
-        member = ctx.bot.get_chat_member(ctx.chat_id, ctx.user_id)
-        status = (member.get("status") or "").lower()
-        if status not in ("creator", "administrator"):
+        if not is_chat_admin_or_creator(ctx.bot, ctx.chat_id, ctx.user_id):
             ctx.reply(
                 get_translated_text("stats_admin_only", ctx.lang_code),
                 ctx.message_id,
@@ -87,12 +93,7 @@ def handle_stats(ctx: Context) -> None:
         start_date = stats["started_at"]
 
         activity_level_percentage = int(min(100, 100 * verified / max(1, total)))
-        if activity_level_percentage < 30:
-            level_key = "activity_low"
-        elif activity_level_percentage < 70:
-            level_key = "activity_medium"
-        else:
-            level_key = "activity_high"
+        level_key = _ACTIVITY_KEYS[bisect_right(_ACTIVITY_THRESHOLDS, activity_level_percentage)]
 
         activity_level = get_translated_text(level_key, ctx.lang_code)
         msg = get_translated_text(
@@ -96,18 +96,19 @@ def handle_quizstats(ctx: Context) -> None:
     user_id = str(ctx.user_id)
     lang = ctx.lang_code
 
-    user_score = ctx.quiz_repo.get_user_score(chat_id, user_id)
-    if not user_score:
-        ctx.reply(get_translated_text("quizstats_no_data", lang))
-        return
-
-    # Calculate rank
+    # The leaderboard query returns the caller's own score item too: one round-trip for score and rank.
     leaderboard = ctx.quiz_repo.get_leaderboard(chat_id)
+    user_sk = f"USER#{user_id}"
+    user_score = None
     rank = 1
     for i, entry in enumerate(leaderboard):
-        if entry.get("SK") == f"USER#{user_id}":
+        if entry.get("SK") == user_sk:
+            user_score = entry
             rank = i + 1
             break
+    if not user_score:
+        ctx.reply(get_translated_text("quizstats_no_data", lang))
+        return
 
     chat_title = _html_chat_title_for_pm(ctx.bot, ctx.chat_id)
 
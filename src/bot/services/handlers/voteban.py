@@ -1,6 +1,7 @@
 """Vote-to-ban: initiate votes and process for/against callbacks."""
 
-from typing import Any
+import time
+from typing import Any, Callable
 
 from core.config import (
     VOTEBAN_AGAINST_PREFIX,
@@ -12,9 +13,40 @@ from core.dispatcher import Context
 from core.logger import LoggerAdapter, get_logger
 from core.translations import get_translated_text
 from core.utils import format_mention
+from services.spam.chat_member import get_chat_member_cached
 
 logger = LoggerAdapter(get_logger(__name__), {})
 
+# Telegram redelivers an update when the webhook errors or times out. A callback already handled in this warm
+# container is dropped before add_vote: no DynamoDB write, and no spurious "already voted" alert.
+_PROCESSED_CALLBACK_TTL_SECONDS = 300.0
+_PROCESSED_CALLBACK_MAX_ENTRIES = 4096
+_processed_callbacks: dict[str, float] = {}
+
+# callback_data is "<prefix><target_user_id>"; one split and one lookup give both the direction and the id.
+_VOTE_PREFIXES: dict[str, bool] = {VOTEBAN_FOR_PREFIX: True, VOTEBAN_AGAINST_PREFIX: False}
+
+
+def _callback_already_processed(callback_query_id: str | None) -> bool:
+    if not callback_query_id:
+        return False
+    expires_at = _processed_callbacks.get(callback_query_id)
+    return expires_at is not None and expires_at > time.monotonic()
+
+
+def _remember_callback(callback_query_id: str | None) -> None:
+    if not callback_query_id:
+        return
+    _processed_callbacks.pop(callback_query_id, None)
+    if len(_processed_callbacks) >= _PROCESSED_CALLBACK_MAX_ENTRIES:
+        del _processed_callbacks[next(iter(_processed_callbacks))]  # oldest insertion first
+    _processed_callbacks[callback_query_id] = time.monotonic() + _PROCESSED_CALLBACK_TTL_SECONDS
+
+
+def clear_processed_callbacks() -> None:
+    """Forget remembered callback ids (tests)."""
+    _processed_callbacks.clear()
+
 
 def _format_voter_list(voter_info_list: list[dict[str, Any]]) -> str:
     """Format a list of voter info dicts into a comma-separated mention string."""
@@ -76,9 +108,11 @@ def handle_voteban_command(ctx: Context) -> None:
             )
             return
 
-        member = ctx.bot.get_chat_member(ctx.chat_id, target_user_id)
-        status = (member.get("status") or "").lower()
-        if status in ("creator", "administrator"):
+        # Per-member lookup, not the admin list: getChatAdministrators never lists bots, this one included.
+        member = get_chat_member_cached(ctx.bot, ctx.chat_id, target_user_id)
+        if member is None:
+            raise RuntimeError(f"get_chat_member failed for target {target_user_id}")
+        if member.get("status") in ("creator", "administrator"):
             ctx.reply(
                 get_translated_text("voteban_admin", ctx.lang_code),
                 ctx.message_id,
@@ -109,7 +143,7 @@ def handle_voteban_command(ctx: Context) -> None:
                 extra={"reply_to_message_id": ctx.reply_to_message.get("message_id")},
             )
             if sent_message_id:
-                ctx.vote_repo.create_vote_session(
+                created = ctx.vote_repo.create_vote_session(
                     chat_id=ctx.chat_id,
                     target_user_id=target_user_id,
                     reply_message_id=ctx.reply_to_message.get("message_id"),
@@ -120,6 +154,18 @@ def handle_voteban_command(ctx: Context) -> None:
                     target_username=target_username,
                     target_first_name=target_first_name,
                 )
+                if not created:
+                    # Another /voteban for this target is still open: turn the duplicate into a pointer to it.
+                    ctx.bot.edit_message_text(
+                        ctx.chat_id,
+                        sent_message_id,
+                        get_translated_text("voteban_in_progress", ctx.lang_code, TARGET=target_mention),
+                    )
+                    logger.info(
+                        "Vote session already in progress",
+                        extra={"chat_id": ctx.chat_id, "target_user_id": target_user_id},
+                    )
+                    return
                 logger.info(
                     "Vote session created",
                     extra={
@@ -138,10 +184,13 @@ def handle_voteban_command(ctx: Context) -> None:
 
 def handle_vote_callback(ctx: Context) -> None:
     """Process a vote-for or vote-against callback."""
-    vote_for = ctx.callback_data.startswith(VOTEBAN_FOR_PREFIX)
-    prefix = VOTEBAN_FOR_PREFIX if vote_for else VOTEBAN_AGAINST_PREFIX
+    prefix, _, raw_target_id = ctx.callback_data.rpartition("_")
+    vote_for = _VOTE_PREFIXES[prefix + "_"]
+    target_user_id = int(raw_target_id.strip())
 
-    target_user_id = int(ctx.callback_data[len(prefix) :].strip())
+    if _callback_already_processed(ctx.callback_query_id):
+        logger.info("Duplicate vote callback ignored", extra={"callback_query_id": ctx.callback_query_id})
+        return
 
     result = ctx.vote_repo.add_vote(
         ctx.chat_id,
@@ -151,6 +200,23 @@ def handle_vote_callback(ctx: Context) -> None:
         voter_username=ctx.username,
         voter_first_name=ctx.first_name,
     )
+    # Remembered only once handled: if answering or finalizing raises, a redelivery must not be dropped unanswered.
+    _apply_vote_result(ctx, target_user_id, result)
+    _remember_callback(ctx.callback_query_id)
+
+
+# ── Private helpers ──────────────────────────────────────────────────────────
+
+
+def _apply_vote_result(ctx: Context, target_user_id: int, result: dict[str, Any]) -> None:
+    """Answer the callback and finalize or re-render the vote message for an ``add_vote`` result."""
+    if result.get("session_closed"):
+        ctx.bot.answer_callback_query(
+            ctx.callback_query_id,
+            text=get_translated_text("voteban_closed", ctx.lang_code),
+            show_alert=True,
+        )
+        return
 
     if result["already_voted"]:
         ctx.bot.answer_callback_query(
@@ -160,77 +226,95 @@ def handle_vote_callback(ctx: Context) -> None:
         )
         return
 
-    ctx.bot.answer_callback_query(
+    # Answered in the background: finalizing or re-rendering the vote message overlaps with this round-trip.
+    ctx.bot.answer_callback_query_async(
         ctx.callback_query_id,
         text=get_translated_text("voteban_vote_recorded", ctx.lang_code),
     )
 
     votes_for = result["votes_for"]
     votes_against = result["votes_against"]
+    session = result.get("session")
 
     if votes_for >= VOTEBAN_THRESHOLD:
-        _finalize_ban(ctx, target_user_id, votes_for)
+        _finalize_once(ctx, target_user_id, _finalize_ban, votes_for, session)
         return
 
     if votes_against >= VOTEBAN_FORGIVE_THRESHOLD:
-        _finalize_forgive(ctx, target_user_id, votes_against)
+        _finalize_once(ctx, target_user_id, _finalize_forgive, votes_against, session)
         return
 
-    _update_vote_message(ctx, target_user_id, votes_for, votes_against)
-
+    _update_vote_message(ctx, target_user_id, votes_for, votes_against, session)
 
-# ── Private helpers ──────────────────────────────────────────────────────────
 
+def _finalize_once(
+    ctx: Context,
+    target_user_id: int,
+    finalize: Callable[[Context, int, int, dict[str, Any] | None], None],
+    votes: int,
+    session: dict[str, Any] | None,
+) -> None:
+    """Run *finalize* for the one vote that claims the session; a failed finalize releases the claim.
 
-def _finalize_ban(ctx: Context, target_user_id: int, votes_for: int) -> None:
-    """Execute a ban after the vote threshold is reached."""
+    Racing deciding clicks in parallel invocations can't ban twice, and a ban that fails (missing rights, a
+    Telegram error) is retried by the next vote instead of leaving the session stuck.
+    """
+    if not ctx.vote_repo.claim_finalization(ctx.chat_id, target_user_id):
+        return  # a concurrent vote is already closing this session
     try:
+        finalize(ctx, target_user_id, votes, session)
+    except Exception as e:
+        logger.exception("Vote finalization failed", extra={"target_user_id": target_user_id, "error": e})
+        ctx.vote_repo.release_finalization(ctx.chat_id, target_user_id)
+
+
+def _finalize_ban(ctx: Context, target_user_id: int, votes_for: int, session: dict[str, Any] | None = None) -> None:
+    """Execute a ban after the vote threshold is reached (raises on failure; see :func:`_finalize_once`)."""
+    if session is None:
         session = ctx.vote_repo.get_vote_session(ctx.chat_id, target_user_id)
-        target_mention = format_mention(
-            target_user_id,
-            session.get("target_username"),
-            session.get("target_first_name", "User"),
-        )
+    target_mention = format_mention(
+        target_user_id,
+        session.get("target_username"),
+        session.get("target_first_name", "User"),
+    )
 
-        voters_for_mention = _format_voter_list(session.get("votes_for_info", []))
+    voters_for_mention = _format_voter_list(session.get("votes_for_info", []))
 
-        ctx.bot.kick_chat_member(ctx.chat_id, target_user_id)
-        ctx.bot.send_message(
-            ctx.chat_id,
-            get_translated_text(
-                "voteban_banned",
-                TARGET=target_mention,
-                VOTES_FOR=votes_for,
-                VOTERS_FOR=voters_for_mention,
-            ),
-        )
+    ctx.bot.kick_chat_member(ctx.chat_id, target_user_id)
+    ctx.bot.send_message(
+        ctx.chat_id,
+        get_translated_text(
+            "voteban_banned",
+            TARGET=target_mention,
+            VOTES_FOR=votes_for,
+            VOTERS_FOR=voters_for_mention,
+        ),
+    )
 
-        sent_message_id = session.get("reply_message_id")
-        logger.info(
-            "Deleting vote message and user's reply message",
-            extra={"msg_id": ctx.message_id, "sent_message_id": sent_message_id},
-        )
-        if ctx.message_id and sent_message_id:
-            try:
-                ctx.bot.delete_message(ctx.chat_id, ctx.message_id)
-                ctx.bot.delete_message(ctx.chat_id, sent_message_id)
-            except Exception:
-                logger.exception(f"Failed to delete vote message: {ctx.message_id}")
-
-        ctx.vote_repo.delete_vote_session(ctx.chat_id, target_user_id)
-        if ctx.stats_repo:
-            try:
-                ctx.stats_repo.increment_total_bans(ctx.chat_id)
-            except Exception as e:
-                logger.exception(f"Failed to record ban stat: {e}")
-        logger.info("User %s banned by vote.", target_user_id)
-    except Exception as e:
-        logger.exception(f"Failed to ban user: {e}")
+    sent_message_id = session.get("reply_message_id")
+    logger.info(
+        "Deleting vote message and user's reply message",
+        extra={"msg_id": ctx.message_id, "sent_message_id": sent_message_id},
+    )
+    if ctx.message_id and sent_message_id:
+        # Cleanup runs in the background while the session is deleted and the ban stat recorded.
+        ctx.bot.delete_messages_async(ctx.chat_id, [ctx.message_id, sent_message_id])
 
+    ctx.vote_repo.delete_vote_session(ctx.chat_id, target_user_id)
+    if ctx.stats_repo:
+        try:
+            ctx.stats_repo.increment_total_bans(ctx.chat_id)
+        except Exception as e:
+            logger.exception(f"Failed to record ban stat: {e}")
+    logger.info("User %s banned by vote.", target_user_id)
 
-def _finalize_forgive(ctx: Context, target_user_id: int, votes_against: int) -> None:
+
+def _finalize_forgive(
+    ctx: Context, target_user_id: int, votes_against: int, session: dict[str, Any] | None = None
+) -> None:
     """Cancel a voteban after the forgive threshold is reached."""
-    session = ctx.vote_repo.get_vote_session(ctx.chat_id, target_user_id)
+    if session is None:
+        session = ctx.vote_repo.get_vote_session(ctx.chat_id, target_user_id)
     target_mention = format_mention(
         target_user_id,
         session.get("target_username"),
@@ -251,11 +335,7 @@ def _finalize_forgive(ctx: Context, target_user_id: int, votes_against: int) ->
 
     sent_message_id = session.get("sent_message_id")
     if ctx.message_id and sent_message_id:
-        try:
-            ctx.bot.delete_message(ctx.chat_id, ctx.message_id)
-            ctx.bot.delete_message(ctx.chat_id, sent_message_id)
-        except Exception:
-            logger.exception(f"Failed to delete vote message: {ctx.message_id}")
+        ctx.bot.delete_messages_async(ctx.chat_id, [ctx.message_id, sent_message_id])
 
     ctx.vote_repo.delete_vote_session(ctx.chat_id, target_user_id)
     logger.info("User %s forgiven by vote.", target_user_id)
@@ -266,10 +346,12 @@ def _update_vote_message(
     target_user_id: int,
     votes_for: int,
     votes_against: int,
+    session: dict[str, Any] | None = None,
 ) -> None:
     """Update the inline vote message with current tallies."""
     try:
-        session = ctx.vote_repo.get_vote_session(ctx.chat_id, target_user_id)
+        if session is None:
+            session = ctx.vote_repo.get_vote_session(ctx.chat_id, target_user_id)
         target_mention = format_mention(
             target_user_id,
             session.get("target_username"),
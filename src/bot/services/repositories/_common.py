@@ -1,13 +1,41 @@
-"""Shared DynamoDB resource (lazy singleton)."""
+"""Shared DynamoDB resource, Table objects and low-level client (lazy singletons)."""
 
 import boto3
+from botocore.config import Config
+
+# Single-item reads/writes inside the webhook request: fail fast instead of botocore's 60s read timeout.
+# Adaptive retries back off client-side on throttling rather than adding load with fixed-rate retries.
+_DYNAMODB_CONFIG = Config(
+    connect_timeout=1,
+    read_timeout=2,
+    retries={"mode": "adaptive", "max_attempts": 3},
+    tcp_keepalive=True,
+)
 
 _dynamodb_resource = None
+_dynamodb_client = None
+_tables: dict = {}
 
 
 def get_dynamodb():
     """Return a shared boto3 DynamoDB resource, creating it lazily."""
     global _dynamodb_resource
     if _dynamodb_resource is None:
-        _dynamodb_resource = boto3.resource("dynamodb")
+        _dynamodb_resource = boto3.resource("dynamodb", config=_DYNAMODB_CONFIG)
     return _dynamodb_resource
+
+
+def get_table(table_name: str):
+    """Return the shared ``Table`` resource for *table_name* (``Resource.Table()`` builds a new object per call)."""
+    table = _tables.get(table_name)
+    if table is None:
+        table = _tables[table_name] = get_dynamodb().Table(table_name)
+    return table
+
+
+def get_dynamodb_client():
+    """Return a shared low-level DynamoDB client (typed ``{"S": ...}`` values, no (de)serializer pass)."""
+    global _dynamodb_client
+    if _dynamodb_client is None:
+        _dynamodb_client = boto3.client("dynamodb", config=_DYNAMODB_CONFIG)
+    return _dynamodb_client
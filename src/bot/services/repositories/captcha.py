@@ -6,7 +6,7 @@ from typing import Any
 from botocore.exceptions import ClientError
 from core.config import CAPTCHA_TIMEOUT_SECONDS, STATS_TABLE_NAME
 from core.logger import LoggerAdapter, get_logger
-from services.repositories._common import get_dynamodb
+from services.repositories._common import get_table
 
 logger = LoggerAdapter(get_logger(__name__), {})
 
@@ -25,7 +25,7 @@ class CaptchaRepository:
 
     @property
     def _table(self):
-        return get_dynamodb().Table(STATS_TABLE_NAME)
+        return get_table(STATS_TABLE_NAME)
 
     def save_pending(
         self,
@@ -103,6 +103,19 @@ class CaptchaRepository:
             logger.exception("Failed to increment attempts: %s", e)
             return 1
 
+    def extend_pending(self, chat_id: int | str, user_id: int | str, seconds: int) -> None:
+        """Push the pending entry's TTL *seconds* from now (a timeout task is being retried)."""
+        try:
+            self._table.update_item(
+                Key={"stat_key": _key(chat_id, user_id)},
+                UpdateExpression="SET #ttl = :ttl",
+                ConditionExpression="attribute_exists(stat_key)",
+                ExpressionAttributeNames={"#ttl": "ttl"},
+                ExpressionAttributeValues={":ttl": int(time.time()) + seconds},
+            )
+        except ClientError as e:
+            logger.warning("Failed to extend pending captcha: %s", e)
+
     def delete_pending(self, chat_id: int | str, user_id: int | str) -> None:
         try:
             self._table.delete_item(Key={"stat_key": _key(chat_id, user_id)})
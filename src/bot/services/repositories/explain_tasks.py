@@ -7,7 +7,7 @@ from datetime import datetime, timedelta, timezone
 from botocore.exceptions import ClientError
 from core.config import STATS_TABLE_NAME
 from core.logger import LoggerAdapter, get_logger
-from services.repositories._common import get_dynamodb
+from services.repositories._common import get_table
 
 logger = LoggerAdapter(get_logger(__name__), {})
 
@@ -26,7 +26,7 @@ class ExplainTaskRepository:
 
     @property
     def _table(self):
-        return get_dynamodb().Table(STATS_TABLE_NAME)
+        return get_table(STATS_TABLE_NAME)
 
     @staticmethod
     def _stat_key(update_id: int) -> str:
@@ -13,7 +13,7 @@ from zoneinfo import ZoneInfo
 from botocore.exceptions import ClientError
 from core.config import GEMINI_RPD_LIMIT, STATS_TABLE_NAME
 from core.logger import LoggerAdapter, get_logger
-from services.repositories._common import get_dynamodb
+from services.repositories._common import get_table
 
 logger = LoggerAdapter(get_logger(__name__), {})
 
@@ -39,7 +39,7 @@ class RateLimitRepository:
 
     @property
     def _table(self):
-        return get_dynamodb().Table(STATS_TABLE_NAME)
+        return get_table(STATS_TABLE_NAME)
 
     @staticmethod
     def _today_pt() -> str:
@@ -1,20 +1,39 @@
 """SQS client for deferred timeout tasks."""
 
-import json
-
 import boto3
+from botocore.config import Config
 from core.config import QUEUE_URL
 from core.logger import LoggerAdapter, get_logger
+from zerde_common.json_utils import dumps_compact
 
 logger = LoggerAdapter(get_logger(__name__), {})
 
+_SQS_BATCH_LIMIT = 10  # SendMessageBatch hard limit
+
+# Enqueues run inside the webhook request: fail fast instead of botocore's 60s read / legacy retries.
+_SQS_CONFIG = Config(
+    connect_timeout=2,
+    read_timeout=5,
+    retries={"mode": "standard", "max_attempts": 3},
+    tcp_keepalive=True,
+)
+
+# Fixed-schema CHECK_TIMEOUT body: formatting four ints is cheaper than building a dict for json to encode.
+_TIMEOUT_TASK_TEMPLATE = (
+    '{"task_type":"CHECK_TIMEOUT","chat_id":%d,"user_id":%d,"join_message_id":%d,"verification_message_id":%d}'
+)
+
 _SQS_CLIENT = None
 
 
+def _timeout_task_body(chat_id: int, user_id: int, join_message_id: int, verification_message_id: int) -> str:
+    return _TIMEOUT_TASK_TEMPLATE % (chat_id, user_id, join_message_id, verification_message_id)
+
+
 def _get_sqs_client():
     global _SQS_CLIENT
     if _SQS_CLIENT is None:
-        _SQS_CLIENT = boto3.client("sqs")
+        _SQS_CLIENT = boto3.client("sqs", config=_SQS_CONFIG)
     return _SQS_CLIENT
 
 
@@ -23,7 +42,9 @@ class SQSClient:
 
     def __init__(self) -> None:
         self.queue_url = QUEUE_URL
-        logger.debug(f"SQS client initialized with queue URL: {self.queue_url}")
+        # Built with the module-level SQSClient in webhook.py, i.e. during Lambda init, not the first request.
+        _get_sqs_client()
+        logger.debug("SQS client initialized", extra={"queue_url": self.queue_url})
 
     @property
     def sqs_client(self):
@@ -38,17 +59,10 @@ class SQSClient:
         delay_seconds: int = 120,
     ) -> None:
         """Send a delayed message to SQS to check verification timeout."""
-        payload = {
-            "task_type": "CHECK_TIMEOUT",
-            "chat_id": chat_id,
-            "user_id": user_id,
-            "join_message_id": join_message_id,
-            "verification_message_id": verification_message_id,
-        }
         try:
             self.sqs_client.send_message(
                 QueueUrl=self.queue_url,
-                MessageBody=json.dumps(payload),
+                MessageBody=_timeout_task_body(chat_id, user_id, join_message_id, verification_message_id),
                 DelaySeconds=delay_seconds,
             )
             logger.debug(
@@ -65,6 +79,48 @@ class SQSClient:
             logger.exception("Failed to send timeout task to SQS", extra={"error": e})
             raise
 
+    def send_timeout_tasks(self, tasks: list[dict[str, int]], delay_seconds: int = 120) -> None:
+        """Queue several CHECK_TIMEOUT tasks with SendMessageBatch (one round-trip per 10 tasks).
+
+        Each task carries ``chat_id``, ``user_id``, ``join_message_id`` and ``verification_message_id``.
+        """
+        self._send_batch(
+            [
+                _timeout_task_body(
+                    task["chat_id"],
+                    task["user_id"],
+                    task["join_message_id"],
+                    task["verification_message_id"],
+                )
+                for task in tasks
+            ],
+            delay_seconds=delay_seconds,
+            kind="timeout",
+        )
+
+    def _send_batch(self, bodies: list[str], *, delay_seconds: int = 0, kind: str) -> None:
+        """Send message bodies in SendMessageBatch chunks of 10; per-entry ``DelaySeconds`` keeps mixed delays legal."""
+        for start in range(0, len(bodies), _SQS_BATCH_LIMIT):
+            chunk = bodies[start : start + _SQS_BATCH_LIMIT]
+            entries = [
+                {"Id": str(i), "MessageBody": body, "DelaySeconds": delay_seconds} for i, body in enumerate(chunk)
+            ]
+            try:
+                resp = self.sqs_client.send_message_batch(QueueUrl=self.queue_url, Entries=entries)
+            except Exception as e:
+                logger.exception(f"Failed to send {kind} task batch to SQS", extra={"error": e})
+                raise
+            failed = resp.get("Failed") or []
+            if failed:
+                logger.error(
+                    f"Some {kind} tasks were rejected by SQS",
+                    extra={"failed": failed, "batch_size": len(entries)},
+                )
+            logger.debug(
+                f"Queued {kind} task batch",
+                extra={"count": len(entries) - len(failed), "delay": delay_seconds},
+            )
+
     def send_explain_task(
         self,
         *,
@@ -99,7 +155,7 @@ class SQSClient:
         try:
             self.sqs_client.send_message(
                 QueueUrl=self.queue_url,
-                MessageBody=json.dumps(payload),
+                MessageBody=dumps_compact(payload),
             )
             logger.info(
                 "Queued explain task",
@@ -136,7 +192,7 @@ class SQSClient:
         try:
             self.sqs_client.send_message(
                 QueueUrl=self.queue_url,
-                MessageBody=json.dumps(payload),
+                MessageBody=dumps_compact(payload),
             )
             logger.info(
                 "Queued spam check task",
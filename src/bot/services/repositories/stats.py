@@ -1,27 +1,39 @@
 """Per-chat join/verification counters in DynamoDB."""
 
+import time
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
 from botocore.exceptions import ClientError
 from core.config import STATS_TABLE_NAME
 from core.logger import LoggerAdapter, get_logger
-from services.repositories._common import get_dynamodb
+from services.repositories._common import get_dynamodb_client
 
 logger = LoggerAdapter(get_logger(__name__), {})
 
 _ALMATY_TZ = timezone(timedelta(hours=5))
+_COUNTER_ATTRS = ("total_joins", "verified_users", "total_bans", "spam_bans")
+_STATS_PROJECTION = ", ".join((*_COUNTER_ATTRS, "started_at"))
+
+# started_at has one-second resolution, so the formatted string is reused within the same wall-clock second.
+_now_str_second = -1
+_now_str = ""
 
 
 def _almaty_now_str() -> str:
     """Current time in Almaty (UTC+5) as string for started_at."""
-    return datetime.now(_ALMATY_TZ).strftime("%Y-%m-%d %H:%M:%S UTC+5")
+    global _now_str_second, _now_str
+    second = int(time.time())
+    if second != _now_str_second:
+        _now_str = datetime.fromtimestamp(second, _ALMATY_TZ).strftime("%Y-%m-%d %H:%M:%S UTC+5")
+        _now_str_second = second
+    return _now_str
 
 
 class StatsRepository:
     """Per-chat join / verification counters in DynamoDB.
 
-    PK: ``stat_key = <chat_id>`` (string).
+    PK: ``stat_key = <chat_id>`` (string). Uses the low-level client, so attribute values are typed by hand.
     """
 
     def __init__(self) -> None:
@@ -31,11 +43,11 @@ class StatsRepository:
         )
 
     @property
-    def _table(self):
-        return get_dynamodb().Table(STATS_TABLE_NAME)
+    def _client(self):
+        return get_dynamodb_client()
 
-    def increment_total_joins(self, chat_id: int | str) -> None:
-        self._increment(str(chat_id), "total_joins")
+    def increment_total_joins(self, chat_id: int | str, count: int = 1) -> None:
+        self._increment(str(chat_id), "total_joins", count)
 
     def increment_verified_users(self, chat_id: int | str) -> None:
         self._increment(str(chat_id), "verified_users")
@@ -46,35 +58,37 @@ class StatsRepository:
     def increment_spam_bans(self, chat_id: int | str) -> None:
         self._increment(str(chat_id), "spam_bans")
 
-    def _increment(self, stat_key: str, attr: str) -> None:
+    def _increment(self, stat_key: str, attr: str, amount: int = 1) -> None:
         try:
-            self._table.update_item(
-                Key={"stat_key": stat_key},
+            self._client.update_item(
+                TableName=STATS_TABLE_NAME,
+                Key={"stat_key": {"S": stat_key}},
                 UpdateExpression=("SET #a = if_not_exists(#a, :zero) + :inc, " "#d = if_not_exists(#d, :now)"),
                 ExpressionAttributeNames={"#a": attr, "#d": "started_at"},
                 ExpressionAttributeValues={
-                    ":inc": 1,
-                    ":zero": 0,
-                    ":now": _almaty_now_str(),
+                    ":inc": {"N": str(amount)},
+                    ":zero": {"N": "0"},
+                    ":now": {"S": _almaty_now_str()},
                 },
             )
         except ClientError as e:
-            logger.exception(f"Failed to increment {attr}: {e}")
+            logger.exception("Failed to increment stat", extra={"stat_key": stat_key, "attr": attr, "error": e})
             raise
 
     def get_stats(self, chat_id: int | str) -> dict[str, Any]:
         """Return total_joins, verified_users, total_bans, and started_at for a chat."""
         key = str(chat_id)
         try:
-            resp = self._table.get_item(Key={"stat_key": key}, ConsistentRead=False)
+            resp = self._client.get_item(
+                TableName=STATS_TABLE_NAME,
+                Key={"stat_key": {"S": key}},
+                ConsistentRead=False,
+                ProjectionExpression=_STATS_PROJECTION,
+            )
             item: dict[str, Any] = resp.get("Item") or {}
-            return {
-                "total_joins": item.get("total_joins", 0),
-                "verified_users": item.get("verified_users", 0),
-                "total_bans": item.get("total_bans", 0),
-                "spam_bans": item.get("spam_bans", 0),
-                "started_at": item.get("started_at", "N/A"),
-            }
+            stats: dict[str, Any] = {attr: int(item[attr]["N"]) if attr in item else 0 for attr in _COUNTER_ATTRS}
+            stats["started_at"] = item["started_at"]["S"] if "started_at" in item else "N/A"
+            return stats
         except ClientError as e:
-            logger.exception(f"Failed to get stats: {e}")
+            logger.exception("Failed to get stats", extra={"stat_key": key, "error": e})
             raise
@@ -3,20 +3,95 @@
 import time
 from typing import Any
 
+from boto3.dynamodb.types import TypeDeserializer
 from botocore.exceptions import ClientError
 from core.config import STATS_TABLE_NAME
 from core.logger import LoggerAdapter, get_logger
-from services.repositories._common import get_dynamodb
+from services.repositories._common import get_dynamodb_client, get_table
 
 logger = LoggerAdapter(get_logger(__name__), {})
 
 VOTEBAN_TTL_SECONDS = 3 * 60 * 60  # 3 hours
 
+_deserializer = TypeDeserializer()
+
+# add_vote request parts that don't depend on the voter, built once per container.
+_ADD_VOTE_UPDATE_EXPRS = {
+    vote_for: (
+        f"ADD {attr} :voter_set SET {attr}_info = list_append(if_not_exists({attr}_info, :empty_info_list), "
+        ":voter_info_list)"
+    )
+    for vote_for, attr in ((True, "votes_for"), (False, "votes_against"))
+}
+# Sessions opened before the set migration hold L-typed voter lists (ADD on them is a ValidationException);
+# while they live out their TTL, votes on them keep the original list_append update.
+_LEGACY_ADD_VOTE_UPDATE_EXPRS = {
+    vote_for: (
+        f"SET {attr} = list_append(if_not_exists({attr}, :empty_list), :voter_list), "
+        f"{attr}_info = list_append(if_not_exists({attr}_info, :empty_info_list), :voter_info_list)"
+    )
+    for vote_for, attr in ((True, "votes_for"), (False, "votes_against"))
+}
+# attribute_exists: a click on a session that was already finalized (deleted) must not recreate it as a
+# ttl-less stub that would block every later /voteban for the target.
+# attribute_not_exists(finalized): votes stop while one vote is closing the session (see claim_finalization).
+_ADD_VOTE_CONDITION = (
+    "attribute_exists(stat_key) AND attribute_not_exists(finalized) "
+    "AND (NOT contains(#votes_for, :voter_id)) AND (NOT contains(#votes_against, :voter_id))"
+)
+_ADD_VOTE_NAMES = {"#votes_for": "votes_for", "#votes_against": "votes_against"}
+_EMPTY_LIST: dict[str, Any] = {"L": []}
+
+
+def _raw_vote_count(item: dict[str, Any], attr: str) -> int:
+    """Voter count from a low-level (typed) item: ``NS``, or ``L`` for sessions written before the set migration."""
+    value = item.get(attr) or {}
+    return len(value.get("NS") or value.get("L") or ())
+
+
+# Session fields the voteban handlers actually read; the voter sets are only counted, via add_vote.
+_SESSION_FIELDS = (
+    "reply_message_id",
+    "sent_message_id",
+    "initiator_user_id",
+    "initiator_username",
+    "initiator_first_name",
+    "target_username",
+    "target_first_name",
+)
+
+
+# get_vote_session reads only what _session_from_item keeps; the voter sets (which grow per vote) stay server-side.
+_SESSION_PROJECTION = ", ".join((*_SESSION_FIELDS, "votes_for_info", "votes_against_info"))
+
+
+# Deserialized DynamoDB numbers are Decimal, which Telegram request bodies (JSON) can't carry.
+_SESSION_INT_FIELDS = ("reply_message_id", "sent_message_id", "initiator_user_id")
+
+
+def _session_from_item(item: dict[str, Any]) -> dict[str, Any]:
+    """Vote session dict from a resource-style (deserialized) item; message and user ids come back as ``int``."""
+    session = {field: item.get(field) for field in _SESSION_FIELDS}
+    for field in _SESSION_INT_FIELDS:
+        if session[field] is not None:
+            session[field] = int(session[field])
+    for field in ("votes_for_info", "votes_against_info"):
+        session[field] = [{**voter, "id": int(voter["id"])} for voter in item.get(field) or []]
+    return session
+
+
+def _session_from_raw_item(item: dict[str, Any]) -> dict[str, Any]:
+    """Vote session dict from a low-level (typed) item, e.g. ``update_item`` ``ALL_NEW`` attributes."""
+    wanted = (*_SESSION_FIELDS, "votes_for_info", "votes_against_info")
+    return _session_from_item({k: _deserializer.deserialize(item[k]) for k in wanted if k in item})
+
 
 class VoteRepository:
     """Vote-to-ban sessions on the same DynamoDB table.
 
-    PK: ``stat_key = voteban_<chat_id>_<target_user_id>``.
+    PK: ``stat_key = voteban_<chat_id>_<target_user_id>``; chat and target ids live only in the key.
+    ``votes_for`` / ``votes_against`` are number sets (DynamoDB can't store an empty set, so a side with no votes
+    has no attribute yet).
     """
 
     def __init__(self) -> None:
@@ -24,30 +99,20 @@ class VoteRepository:
 
     @property
     def _table(self):
-        return get_dynamodb().Table(STATS_TABLE_NAME)
+        return get_table(STATS_TABLE_NAME)
 
     def get_vote_session(self, chat_id: int | str, target_user_id: int) -> dict[str, Any]:
         """Get vote session data for a target user in a chat."""
         key = f"voteban_{chat_id}_{target_user_id}"
         try:
-            resp = self._table.get_item(Key={"stat_key": key}, ConsistentRead=False)
-            item: dict[str, Any] = resp.get("Item") or {}
-            return {
-                "votes_for": set(item.get("votes_for", [])),
-                "votes_against": set(item.get("votes_against", [])),
-                "votes_for_info": list(item.get("votes_for_info", [])),
-                "votes_against_info": list(item.get("votes_against_info", [])),
-                "reply_message_id": item.get("reply_message_id"),
-                "sent_message_id": item.get("sent_message_id"),
-                "target_user_id": item.get("target_user_id"),
-                "initiator_user_id": item.get("initiator_user_id"),
-                "initiator_username": item.get("initiator_username"),
-                "initiator_first_name": item.get("initiator_first_name"),
-                "target_username": item.get("target_username"),
-                "target_first_name": item.get("target_first_name"),
-            }
+            resp = self._table.get_item(
+                Key={"stat_key": key},
+                ConsistentRead=False,
+                ProjectionExpression=_SESSION_PROJECTION,
+            )
+            return _session_from_item(resp.get("Item") or {})
         except ClientError as e:
-            logger.exception(f"Failed to get vote session: {e}")
+            logger.exception("Failed to get vote session", extra={"stat_key": key, "error": e})
             raise
 
     def create_vote_session(
@@ -61,14 +126,18 @@ class VoteRepository:
         initiator_first_name: str = "User",
         target_username: str | None = None,
         target_first_name: str = "User",
-    ) -> None:
-        """Create a new vote session with the initiator's vote and user info."""
+    ) -> bool:
+        """Create a new vote session with the initiator's vote and user info.
+
+        Returns False (writing nothing) when a live session for this target already exists, so a second
+        ``/voteban`` can't wipe the votes already cast.
+        """
         key = f"voteban_{chat_id}_{target_user_id}"
+        now = int(time.time())
         try:
             self._table.put_item(
                 Item={
                     "stat_key": key,
-                    "target_user_id": target_user_id,
                     "reply_message_id": reply_message_id,
                     "sent_message_id": sent_message_id,
                     "initiator_user_id": initiator_user_id,
@@ -76,8 +145,7 @@ class VoteRepository:
                     "initiator_first_name": initiator_first_name,
                     "target_username": target_username,
                     "target_first_name": target_first_name,
-                    "votes_for": [initiator_user_id],
-                    "votes_against": [],
+                    "votes_for": {initiator_user_id},
                     "votes_for_info": [
                         {
                             "id": initiator_user_id,
@@ -86,11 +154,19 @@ class VoteRepository:
                         }
                     ],
                     "votes_against_info": [],
-                    "ttl": int(time.time()) + VOTEBAN_TTL_SECONDS,
-                }
+                    "ttl": now + VOTEBAN_TTL_SECONDS,
+                },
+                # An expired session the TTL sweeper hasn't removed yet doesn't count as live, nor does an item
+                # without a ttl (the sweeper would never remove it).
+                ConditionExpression="attribute_not_exists(stat_key) OR attribute_not_exists(#ttl) OR #ttl < :now",
+                ExpressionAttributeNames={"#ttl": "ttl"},
+                ExpressionAttributeValues={":now": now},
             )
+            return True
         except ClientError as e:
-            logger.exception(f"Failed to create vote session: {e}")
+            if e.response.get("Error", {}).get("Code") == "ConditionalCheckFailedException":
+                return False
+            logger.exception("Failed to create vote session", extra={"stat_key": key, "error": e})
             raise
 
     def add_vote(
@@ -102,65 +178,119 @@ class VoteRepository:
         voter_username: str | None = None,
         voter_first_name: str = "User",
     ) -> dict[str, Any]:
-        """Atomically add a vote; returns updated counts and ``already_voted`` flag."""
+        """Atomically add a vote; returns updated counts and ``already_voted`` / ``session_closed`` flags.
+
+        A recorded vote also carries ``session`` (the updated item, same shape as :meth:`get_vote_session`), so
+        callers can render or finalize without reading the session back.
+        """
         key = f"voteban_{chat_id}_{target_user_id}"
-        attribute_name = "votes_for" if vote_for else "votes_against"
-        info_attribute_name = "votes_for_info" if vote_for else "votes_against_info"
 
-        try:
-            update_expr = (
-                f"SET {attribute_name} = list_append("
-                f"if_not_exists({attribute_name}, :empty_list), :voter_list), "
-                f"{info_attribute_name} = list_append("
-                f"if_not_exists({info_attribute_name}, :empty_info_list), :voter_info_list)"
-            )
-            condition_expr = "(NOT contains(#votes_for, :voter_id)) " "AND (NOT contains(#votes_against, :voter_id))"
-            response = self._table.update_item(
-                Key={"stat_key": key},
-                UpdateExpression=update_expr,
-                ConditionExpression=condition_expr,
-                ExpressionAttributeNames={
-                    "#votes_for": "votes_for",
-                    "#votes_against": "votes_against",
-                },
-                ExpressionAttributeValues={
-                    ":voter_list": [voter_id],
-                    ":voter_id": voter_id,
-                    ":empty_list": [],
-                    ":voter_info_list": [
-                        {
-                            "id": voter_id,
-                            "username": voter_username or "",
-                            "first_name": voter_first_name,
+        values: dict[str, Any] = {
+            ":voter_id": {"N": str(voter_id)},
+            ":voter_info_list": {
+                "L": [
+                    {
+                        "M": {
+                            "id": {"N": str(voter_id)},
+                            "username": {"S": voter_username or ""},
+                            "first_name": {"S": voter_first_name},
                         }
-                    ],
-                    ":empty_info_list": [],
-                },
-                ReturnValues="ALL_NEW",
-            )
+                    }
+                ]
+            },
+            ":empty_info_list": _EMPTY_LIST,
+        }
+
+        try:
+            try:
+                response = self._update_vote(
+                    key,
+                    _ADD_VOTE_UPDATE_EXPRS[vote_for],
+                    {**values, ":voter_set": {"NS": [str(voter_id)]}},
+                )
+            except ClientError as e:
+                if e.response.get("Error", {}).get("Code") != "ValidationException":
+                    raise
+                logger.info("Vote on a pre-migration list session", extra={"stat_key": key})
+                response = self._update_vote(
+                    key,
+                    _LEGACY_ADD_VOTE_UPDATE_EXPRS[vote_for],
+                    {**values, ":voter_list": {"L": [{"N": str(voter_id)}]}, ":empty_list": _EMPTY_LIST},
+                )
 
             updated_item = response.get("Attributes", {})
             return {
-                "votes_for": len(updated_item.get("votes_for", [])),
-                "votes_against": len(updated_item.get("votes_against", [])),
+                "votes_for": _raw_vote_count(updated_item, "votes_for"),
+                "votes_against": _raw_vote_count(updated_item, "votes_against"),
                 "already_voted": False,
+                "session_closed": False,
+                "session": _session_from_raw_item(updated_item),
             }
         except ClientError as e:
             if e.response.get("Error", {}).get("Code") == "ConditionalCheckFailedException":
-                session = self.get_vote_session(chat_id, target_user_id)
+                current = e.response.get("Item") or {}
+                # No old item: the session was finalized (or swept after its TTL) before this click landed;
+                # a finalized flag: another vote is closing it right now.
+                closed = not current or "finalized" in current
                 return {
-                    "votes_for": len(session["votes_for"]),
-                    "votes_against": len(session["votes_against"]),
-                    "already_voted": True,
+                    "votes_for": _raw_vote_count(current, "votes_for"),
+                    "votes_against": _raw_vote_count(current, "votes_against"),
+                    "already_voted": not closed,
+                    "session_closed": closed,
                 }
-            logger.exception(f"Failed to add vote: {e}")
+            logger.exception("Failed to add vote", extra={"stat_key": key, "error": e})
+            raise
+
+    @staticmethod
+    def _update_vote(key: str, update_expression: str, values: dict[str, Any]) -> dict[str, Any]:
+        # Hot path (every vote click): low-level client with typed values, no resource (de)serializer pass.
+        return get_dynamodb_client().update_item(
+            TableName=STATS_TABLE_NAME,
+            Key={"stat_key": {"S": key}},
+            UpdateExpression=update_expression,
+            ConditionExpression=_ADD_VOTE_CONDITION,
+            ExpressionAttributeNames=_ADD_VOTE_NAMES,
+            ExpressionAttributeValues=values,
+            ReturnValues="ALL_NEW",
+            # On a repeat vote the current item comes back with the error, so no follow-up GetItem is needed.
+            ReturnValuesOnConditionCheckFailure="ALL_OLD",
+        )
+
+    def claim_finalization(self, chat_id: int | str, target_user_id: int) -> bool:
+        """Mark the session as being banned/forgiven; False when it is gone or another vote already claimed it."""
+        key = f"voteban_{chat_id}_{target_user_id}"
+        try:
+            self._table.update_item(
+                Key={"stat_key": key},
+                UpdateExpression="SET finalized = :true",
+                ConditionExpression="attribute_exists(stat_key) AND attribute_not_exists(finalized)",
+                ExpressionAttributeValues={":true": True},
+            )
+            return True
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") == "ConditionalCheckFailedException":
+                return False
+            logger.exception("Failed to claim vote finalization", extra={"stat_key": key, "error": e})
             raise
 
+    def release_finalization(self, chat_id: int | str, target_user_id: int) -> None:
+        """Drop a claim whose finalize failed, so the next vote over the threshold retries it."""
+        key = f"voteban_{chat_id}_{target_user_id}"
+        try:
+            self._table.update_item(
+                Key={"stat_key": key},
+                UpdateExpression="REMOVE finalized",
+                ConditionExpression="attribute_exists(stat_key)",
+            )
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") != "ConditionalCheckFailedException":
+                logger.exception("Failed to release vote finalization", extra={"stat_key": key, "error": e})
+
     def delete_vote_session(self, chat_id: int | str, target_user_id: int) -> None:
         """Delete a vote session (after ban or forgiveness)."""
         key = f"voteban_{chat_id}_{target_user_id}"
         try:
             self._table.delete_item(Key={"stat_key": key})
         except ClientError as e:
-            logger.exception(f"Failed to delete vote session: {e}")
+            logger.exception("Failed to delete vote session", extra={"stat_key": key, "error": e})
             raise
@@ -1,24 +1,100 @@
-"""Chat membership helpers for spam flows."""
+"""Chat membership helpers for spam flows and admin-only commands."""
+
+import time
+from typing import Any
 
 from core.logger import LoggerAdapter, get_logger
 from services.telegram import TelegramClient
 
 logger = LoggerAdapter(get_logger(__name__), {})
 
+# A spam check reads the same member up to three times (processor admin check, enforcer admin check,
+# notice @username); status and username barely change, so one getChatMember per warm container per minute.
+_MEMBER_CACHE_TTL_SECONDS = 60.0
+_MEMBER_CACHE_MAX_ENTRIES = 1024
+_member_cache: dict[tuple[int, int], tuple[float, dict[str, Any]]] = {}
 
-def is_chat_admin_or_creator(bot: TelegramClient, chat_id: int, user_id: int) -> bool:
-    """Return True if the user is an administrator or the group creator.
+_ADMIN_STATUSES = frozenset({"administrator", "creator"})
+
+# One getChatAdministrators answers the admin check for every user in the chat, so busy chats stop paying
+# a getChatMember per sender; same TTL as the member cache, which keeps serving @username lookups.
+_admin_cache: dict[int, tuple[float, frozenset[int]]] = {}
+
+
+def get_chat_member_cached(bot: TelegramClient, chat_id: int, user_id: int) -> dict[str, Any] | None:
+    """Return the ``ChatMember`` object, cached for ``_MEMBER_CACHE_TTL_SECONDS``; None (uncached) on API errors."""
+    key = (chat_id, user_id)
+    now = time.monotonic()
+    cached = _member_cache.get(key)
+    if cached is not None and cached[0] > now:
+        return cached[1]
 
-    On API errors, returns False so enforcement behaviour falls back to the previous path.
-    """
     try:
         member = bot.get_chat_member(chat_id, user_id)
-        if not isinstance(member, dict):
-            return False
-        return member.get("status") in ("administrator", "creator")
     except Exception as e:
         logger.debug(
-            "get_chat_member failed for admin check",
+            "get_chat_member failed",
             extra={"chat_id": chat_id, "user_id": user_id, "error": e},
         )
-        return False
+        return None
+    if not isinstance(member, dict):
+        return None
+
+    _member_cache.pop(key, None)
+    if len(_member_cache) >= _MEMBER_CACHE_MAX_ENTRIES:
+        del _member_cache[next(iter(_member_cache))]  # oldest insertion first
+    _member_cache[key] = (now + _MEMBER_CACHE_TTL_SECONDS, member)
+    return member
+
+
+def get_chat_admin_ids_cached(bot: TelegramClient, chat_id: int) -> frozenset[int] | None:
+    """Return the chat's administrator user ids, cached per chat; None (uncached) on API errors."""
+    now = time.monotonic()
+    cached = _admin_cache.get(chat_id)
+    if cached is not None and cached[0] > now:
+        return cached[1]
+
+    try:
+        admins = bot.get_chat_administrators(chat_id)
+    except Exception as e:
+        logger.debug(
+            "get_chat_administrators failed",
+            extra={"chat_id": chat_id, "error": e},
+        )
+        return None
+    if not isinstance(admins, list):
+        return None
+
+    admin_ids = frozenset(a["user"]["id"] for a in admins if isinstance(a, dict) and "id" in a.get("user", {}))
+    _admin_cache.pop(chat_id, None)
+    if len(_admin_cache) >= _MEMBER_CACHE_MAX_ENTRIES:
+        del _admin_cache[next(iter(_admin_cache))]
+    _admin_cache[chat_id] = (now + _MEMBER_CACHE_TTL_SECONDS, admin_ids)
+    return admin_ids
+
+
+def is_chat_admin_or_creator(bot: TelegramClient, chat_id: int, user_id: int) -> bool:
+    """Return True if the user is an administrator or the group creator.
+
+    Uses the per-chat administrator list; if that is unavailable, falls back to
+    :func:`get_chat_member_cached`. When both fail, returns False (uncached)
+    so enforcement behaviour falls back to the previous path.
+    """
+    admin_ids = get_chat_admin_ids_cached(bot, chat_id)
+    if admin_ids is not None:
+        return user_id in admin_ids
+    member = get_chat_member_cached(bot, chat_id, user_id)
+    return member is not None and member.get("status") in _ADMIN_STATUSES
+
+
+def resolve_target_mention(bot: TelegramClient, chat_id: int, user_id: int) -> str:
+    """``@username`` for spam notices when the member has one, else ``ID:<user_id>``."""
+    member = get_chat_member_cached(bot, chat_id, user_id)
+    username = (member or {}).get("user", {}).get("username")
+    return f"@{username}" if username else f"ID:{user_id}"
+
+
+def clear_member_cache() -> None:
+    """Forget all cached members and admin lists (tests)."""
+    _member_cache.clear()
+    _admin_cache.clear()
@@ -4,7 +4,7 @@ from core.config import TELEGRAM_CHANNEL_POST_ACTOR_USER_ID, get_chat_lang
 from core.logger import LoggerAdapter, get_logger
 from core.translations import get_translated_text
 from services.repositories.stats import StatsRepository
-from services.spam.chat_member import is_chat_admin_or_creator
+from services.spam.chat_member import is_chat_admin_or_creator, resolve_target_mention
 from services.telegram import TelegramClient
 
 logger = LoggerAdapter(get_logger(__name__), {})
@@ -37,7 +37,7 @@ class SpamEnforcer:
             "Enforcing spam action",
             extra={"chat_id": chat_id, "user_id": user_id, "message_id": message_id, "reason": reason},
         )
-        target = self._resolve_target(chat_id, user_id)
+        target = resolve_target_mention(self.bot, chat_id, user_id)
 
         try:
             self.bot.delete_message(chat_id, message_id)
@@ -74,21 +74,6 @@ class SpamEnforcer:
                 extra={"chat_id": chat_id, "error": e},
             )
 
-    def _resolve_target(self, chat_id: int, user_id: int) -> str:
-        """Resolve a human-readable target mention for notifications."""
-        try:
-            member = self.bot.get_chat_member(chat_id, user_id)
-            user = member.get("user", {}) if isinstance(member, dict) else {}
-            username = user.get("username")
-            if username:
-                return f"@{username}"
-        except Exception as e:
-            logger.debug(
-                "Failed to resolve spam target username",
-                extra={"chat_id": chat_id, "user_id": user_id, "error": e},
-            )
-        return f"ID:{user_id}"
-
     def _translate_reason(self, reason: str, lang: str) -> str:
         if reason.startswith("rules:"):
             return get_translated_text("spam_reason_rules", lang)
@@ -104,6 +104,17 @@ Message: "@bayashat genquiz деп тағы куиз жасаңызшы."
 """
 
 
+def _parse_verdict(content: str) -> dict:
+    """Parse the model's JSON verdict; tolerate stray prose or ``` fences around the object."""
+    try:
+        return json.loads(content)
+    except json.JSONDecodeError:
+        start, end = content.find("{"), content.rfind("}")
+        if start < 0 or end <= start:
+            raise
+        return json.loads(content[start : end + 1])
+
+
 @dataclass
 class SpamCheckResult:
     label: str  # "SPAM" | "NOT_SPAM"
@@ -165,7 +176,7 @@ class GroqSpamDetector:
 
         data = json.loads(resp.data.decode("utf-8"))
         content = data["choices"][0]["message"]["content"].strip()
-        result = json.loads(content)
+        result = _parse_verdict(content)
         label = result["label"]
         confidence = float(result["confidence"])
         reason = result.get("reason", "unknown")
@@ -4,7 +4,7 @@ from core.config import TELEGRAM_CHANNEL_POST_ACTOR_USER_ID, get_chat_lang
 from core.logger import LoggerAdapter, get_logger
 from core.translations import get_translated_text
 from services.repositories.stats import StatsRepository
-from services.spam.chat_member import is_chat_admin_or_creator
+from services.spam.chat_member import is_chat_admin_or_creator, resolve_target_mention
 from services.spam.enforcer import SpamEnforcer
 from services.spam.groq_detector import GroqSpamDetector
 from services.telegram import TelegramClient
@@ -13,6 +13,7 @@ logger = LoggerAdapter(get_logger(__name__), {})
 
 _CONFIDENCE_THRESHOLD = 0.85
 _detector: GroqSpamDetector | None = None
+_stats_repo: StatsRepository | None = None
 
 
 def _get_detector() -> GroqSpamDetector:
@@ -22,6 +23,13 @@ def _get_detector() -> GroqSpamDetector:
     return _detector
 
 
+def _get_stats_repo() -> StatsRepository:
+    global _stats_repo
+    if _stats_repo is None:
+        _stats_repo = StatsRepository()
+    return _stats_repo
+
+
 def process_spam_check_task(bot: TelegramClient, body: dict) -> None:
     """Process a SPAM_CHECK SQS task: classify with Groq and enforce if confident."""
     try:
@@ -66,7 +74,7 @@ def process_spam_check_task(bot: TelegramClient, body: dict) -> None:
             return
 
         if result.label == "SPAM" and result.confidence > _CONFIDENCE_THRESHOLD:
-            SpamEnforcer(bot, StatsRepository()).enforce(
+            SpamEnforcer(bot, _get_stats_repo()).enforce(
                 chat_id=chat_id,
                 user_id=user_id,
                 message_id=message_id,
@@ -75,7 +83,7 @@ def process_spam_check_task(bot: TelegramClient, body: dict) -> None:
         elif result.label == "SPAM":
             # Low-confidence SPAM: alert admins without taking automated action
             try:
-                target = _resolve_target(bot, chat_id, user_id)
+                target = resolve_target_mention(bot, chat_id, user_id)
                 lang = get_chat_lang(chat_id)
                 notice = get_translated_text("spam_uncertain_notice", lang, TARGET=target)
                 bot.send_message(chat_id, notice)
@@ -88,19 +96,3 @@ def process_spam_check_task(bot: TelegramClient, body: dict) -> None:
             extra={"chat_id": chat_id, "user_id": user_id, "error": e},
             exc_info=True,
         )
-
-
-def _resolve_target(bot: TelegramClient, chat_id: int, user_id: int) -> str:
-    """Resolve a human-readable target mention for uncertain spam alerts."""
-    try:
-        member = bot.get_chat_member(chat_id, user_id)
-        user = member.get("user", {}) if isinstance(member, dict) else {}
-        username = user.get("username")
-        if username:
-            return f"@{username}"
-    except Exception as e:
-        logger.debug(
-            "Failed to resolve uncertain spam target username",
-            extra={"chat_id": chat_id, "user_id": user_id, "error": e},
-        )
-    return f"ID:{user_id}"
@@ -14,6 +14,15 @@ from services.telegram import TelegramClient
 
 logger = LoggerAdapter(get_logger(__name__), {})
 
+_stats_repo: StatsRepository | None = None
+
+
+def _get_stats_repo() -> StatsRepository:
+    global _stats_repo
+    if _stats_repo is None:
+        _stats_repo = StatsRepository()
+    return _stats_repo
+
 
 class SpamScreeningService:
     """Scores incoming messages, enforces high-confidence rule hits, else may enqueue AI check."""
@@ -66,7 +75,7 @@ class SpamScreeningService:
                     "Rule-based spam detected, enforcing",
                     extra={"chat_id": chat_id, "user_id": user_id, "score": score, "rules": triggered_rules},
                 )
-                SpamEnforcer(self._bot, StatsRepository()).enforce(
+                SpamEnforcer(self._bot, _get_stats_repo()).enforce(
                     chat_id=chat_id,
                     user_id=user_id,
                     message_id=message_id,
@@ -27,10 +27,20 @@ def process_sqs_event(
         extra={"record_count": len(event.get("Records", []))},
     )
 
-    for record in event["Records"]:
-        try:
-            body = json.loads(record["body"])
+    records = event["Records"]
+    try:
+        # Decode the whole batch up front: a malformed record fails the invocation before any task has side effects.
+        bodies = [json.loads(record["body"]) for record in records]
+    except (KeyError, TypeError, ValueError) as e:
+        logger.error(
+            "Malformed SQS record body",
+            extra={"message_ids": [record.get("messageId") for record in records], "error": e},
+            exc_info=True,
+        )
+        raise
 
+    for record, body in zip(records, bodies):
+        try:
             task_chat_id = body.get("chat_id")
             if task_chat_id is not None and not is_configured_group_chat(int(task_chat_id)):
                 logger.debug("Skipping SQS task from non-whitelisted chat", extra={"chat_id": task_chat_id})
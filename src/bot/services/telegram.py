@@ -1,21 +1,107 @@
 """Telegram Bot API client."""
 
 import json
+import socket
 import time
-from typing import Any
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Any, Callable
 
 import urllib3
 from core.config import KICK_BAN_DURATION_SECONDS, MAX_EXPLAIN_MEDIA_BYTES, TELEGRAM_API_BASE, get_bot_token
 from core.logger import LoggerAdapter, get_logger
+from urllib3.connection import HTTPConnection
+from zerde_common.json_utils import dumps_utf8
 from zerde_common.logging_utils import truncate_log_text
+from zerde_common.retry import full_jitter_backoff
 
 logger = LoggerAdapter(get_logger(__name__), {})
 
-http = urllib3.PoolManager(maxsize=4, timeout=urllib3.Timeout(total=10))
+# Container-wide pool: SO_KEEPALIVE keeps idle api.telegram.org sockets alive between warm invocations,
+# and the short connect timeout fails fast instead of spending the whole request budget on a dead host.
+http = urllib3.PoolManager(
+    maxsize=4,
+    timeout=urllib3.Timeout(connect=3.05, read=10),
+    socket_options=HTTPConnection.default_socket_options + [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)],
+)
 # Longer timeout for Telegram file downloads (large PDFs under MAX_EXPLAIN_MEDIA_BYTES).
 _file_http = urllib3.PoolManager(maxsize=2, timeout=urllib3.Timeout(connect=10, read=120))
 
 
+# Best-effort calls (callback answers, single deletes) run here so they overlap with the rest of the handler.
+# A frozen Lambda sandbox doesn't run threads, so drain_background() joins them before each invocation returns.
+_background = ThreadPoolExecutor(max_workers=4, thread_name_prefix="telegram-bg")
+_pending: list[Future] = []
+_DRAIN_TIMEOUT_SECONDS = 5.0
+
+_DELETE_MESSAGES_LIMIT = 100  # deleteMessages accepts 1-100 ids
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+_MAX_ATTEMPTS = 3
+_BACKOFF_CAP_SECONDS = 2.0
+# Calls run inside the webhook request: a longer flood-wait fails now instead of stalling the invocation.
+_MAX_RETRY_AFTER_SECONDS = 3.0
+# A 5xx from Telegram's front end can arrive after the call already took effect, so only methods that are
+# safe to apply twice retry on 5xx; sends and bans would post a second message or reset the ban. 429 means
+# the call was rejected outright, so every method retries that.
+_RETRY_ON_5XX_METHODS = frozenset(
+    {
+        "answerCallbackQuery",
+        "deleteMessage",
+        "deleteMessages",
+        "editMessageText",
+        "getChat",
+        "getChatAdministrators",
+        "getChatMember",
+        "getFile",
+        "restrictChatMember",
+        "sendChatAction",
+        "setMessageReaction",
+    }
+)
+
+
+def _retry_delay(method: str, resp: urllib3.BaseHTTPResponse, body: str, attempt: int) -> float | None:
+    """Seconds to wait before retrying a failed call, or None when the error is not retryable."""
+    if resp.status == 429:
+        retry_after: Any = None
+        try:
+            retry_after = json.loads(body).get("parameters", {}).get("retry_after")
+        except (ValueError, AttributeError):
+            pass
+        if retry_after is None:
+            retry_after = resp.headers.get("Retry-After")
+        try:
+            delay = float(retry_after) if retry_after is not None else _backoff_delay(attempt)
+        except ValueError:
+            delay = _backoff_delay(attempt)
+        return delay if delay <= _MAX_RETRY_AFTER_SECONDS else None
+    if resp.status >= 500 and method in _RETRY_ON_5XX_METHODS:
+        return _backoff_delay(attempt)
+    return None
+
+
+def submit_background(fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Future:
+    """Run *fn* on the shared executor; call ``.result()`` where it must have finished (else it's drained)."""
+    future = _background.submit(fn, *args, **kwargs)
+    _pending.append(future)
+    return future
+
+
+def drain_background(timeout: float = _DRAIN_TIMEOUT_SECONDS) -> None:
+    """Wait for fire-and-forget calls submitted during this invocation (failures are already logged)."""
+    if not _pending:
+        return
+    futures = _pending[:]
+    _pending.clear()
+    _, not_done = wait(futures, timeout=timeout)
+    if not_done:
+        logger.warning("Background Telegram calls still running after drain", extra={"count": len(not_done)})
+
+
+def _backoff_delay(attempt: int) -> float:
+    return full_jitter_backoff(attempt, _BACKOFF_CAP_SECONDS)
+
+
 class TelegramAPIError(Exception):
     """Raised when the Telegram API returns an error response."""
 
@@ -32,21 +118,39 @@ class TelegramClient:
         self.bot_token = get_bot_token()
         self.api_base = f"{TELEGRAM_API_BASE}{self.bot_token}"
         self._file_base_url = f"https://api.telegram.org/file/bot{self.bot_token}/"
+        self._method_urls: dict[str, str] = {}
         logger.info("TelegramClient initialized", extra={"api_base": TELEGRAM_API_BASE})
 
+    def _method_url(self, method: str) -> str:
+        """Endpoint URL for *method*, built once per client (the token-bearing prefix never changes)."""
+        url = self._method_urls.get(method)
+        if url is None:
+            url = self._method_urls[method] = f"{self.api_base}/{method}"
+        return url
+
     def _post(self, method: str, payload: dict[str, Any]) -> dict[str, Any]:
-        """POST JSON to the Telegram Bot API and return the parsed result."""
-        url = f"{self.api_base}/{method}"
-        resp = http.request(
-            "POST",
-            url,
-            body=json.dumps(payload),
-            headers={"Content-Type": "application/json"},
-        )
-        body = resp.data.decode("utf-8")
-        if resp.status >= 400:
-            raise TelegramAPIError(resp.status, body)
-        return json.loads(body)
+        """POST JSON to the Telegram Bot API and return the parsed result.
+
+        429 is retried after Telegram's ``retry_after`` (when short enough for the webhook); 5xx with jittered backoff,
+        for idempotent methods only.
+        """
+        url = self._method_url(method)
+        encoded = dumps_utf8(payload)
+        attempt = 0
+        while True:
+            resp = http.request("POST", url, body=encoded, headers=_JSON_HEADERS)
+            if resp.status < 400:
+                return json.loads(resp.data)  # UTF-8 bytes straight into the parser; no decoded str copy
+            body = resp.data.decode("utf-8")
+            delay = _retry_delay(method, resp, body, attempt) if attempt + 1 < _MAX_ATTEMPTS else None
+            if delay is None:
+                raise TelegramAPIError(resp.status, body)
+            logger.warning(
+                "Telegram API call failed, retrying",
+                extra={"method": method, "status": resp.status, "attempt": attempt + 1, "delay": round(delay, 2)},
+            )
+            time.sleep(delay)
+            attempt += 1
 
     def send_message(
         self,
@@ -102,7 +206,7 @@ class TelegramClient:
         parse_mode: str = "HTML",
     ) -> dict[str, Any]:
         """Send a photo (as multipart/form-data) to Telegram. Returns Message object."""
-        url = f"{self.api_base}/sendPhoto"
+        url = self._method_url("sendPhoto")
         fields: dict[str, Any] = {
             "chat_id": str(chat_id),
             "photo": ("captcha.png", photo, "image/png"),
@@ -112,10 +216,9 @@ class TelegramClient:
             fields["parse_mode"] = parse_mode
         try:
             resp = http.request("POST", url, fields=fields)
-            body = resp.data.decode("utf-8")
             if resp.status >= 400:
-                raise TelegramAPIError(resp.status, body)
-            return json.loads(body).get("result", {})
+                raise TelegramAPIError(resp.status, resp.data.decode("utf-8"))
+            return json.loads(resp.data).get("result", {})
         except TelegramAPIError as e:
             logger.error(
                 "Failed to send photo",
@@ -193,6 +296,15 @@ class TelegramClient:
             )
             raise
 
+    def answer_callback_query_async(
+        self,
+        callback_query_id: str,
+        text: str | None = None,
+        show_alert: bool = False,
+    ) -> None:
+        """Fire-and-forget :meth:`answer_callback_query`; joined by :func:`drain_background`."""
+        _pending.append(_background.submit(self.answer_callback_query, callback_query_id, text, show_alert))
+
     def restrict_chat_member(
         self,
         chat_id: int | str,
@@ -255,6 +367,18 @@ class TelegramClient:
             )
             raise
 
+    def get_chat_administrators(self, chat_id: int | str) -> list[dict[str, Any]]:
+        """List the chat's administrators (creator included) as ``ChatMember`` objects."""
+        try:
+            result = self._post("getChatAdministrators", {"chat_id": chat_id})
+            return result.get("result", [])
+        except Exception as e:
+            logger.error(
+                "Failed to get chat administrators",
+                extra={"chat_id": chat_id, "error": str(e)},
+            )
+            raise
+
     def delete_message(self, chat_id: int | str, message_id: int) -> None:
         """Delete a message from Telegram."""
         payload = {"chat_id": chat_id, "message_id": message_id}
@@ -267,6 +391,27 @@ class TelegramClient:
             )
             raise
 
+    def delete_message_async(self, chat_id: int | str, message_id: int) -> None:
+        """Fire-and-forget :meth:`delete_message`; joined by :func:`drain_background`."""
+        _pending.append(_background.submit(self.delete_message, chat_id, message_id))
+
+    def delete_messages(self, chat_id: int | str, message_ids: list[int]) -> None:
+        """Delete several messages in one ``deleteMessages`` call per 100 ids (missing ones are skipped)."""
+        for start in range(0, len(message_ids), _DELETE_MESSAGES_LIMIT):
+            chunk = message_ids[start : start + _DELETE_MESSAGES_LIMIT]
+            try:
+                self._post("deleteMessages", {"chat_id": chat_id, "message_ids": chunk})
+            except Exception as e:
+                logger.error(
+                    "Failed to delete messages",
+                    extra={"message_ids": chunk, "error": str(e)},
+                )
+                raise
+
+    def delete_messages_async(self, chat_id: int | str, message_ids: list[int]) -> None:
+        """Fire-and-forget :meth:`delete_messages`; joined by :func:`drain_background`."""
+        _pending.append(_background.submit(self.delete_messages, chat_id, message_ids))
+
     def edit_message_text(
         self,
         chat_id: int | str,
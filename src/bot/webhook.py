@@ -6,22 +6,33 @@ import json
 from typing import Any
 
 from core.config import (
+    DEFAULT_LANG,
     get_chat_lang,
     get_webhook_secret_token,
     is_configured_group_chat,
 )
 from core.dispatcher import Dispatcher
 from core.logger import LoggerAdapter, get_logger
-from core.translations import get_translated_text
+from core.translations import TRANSLATIONS, get_translated_text
 from services.handlers import process_timeout_task
 from services.repositories.sqs import SQSClient
 from services.spam.screening_service import SpamScreeningService
 from services.telegram import TelegramClient
+from zerde_common.json_utils import dumps_compact
+from zerde_common.logging_utils import api_gateway_event_summary
 
 logger = LoggerAdapter(get_logger(__name__), {})
 
 _sqs_client = SQSClient()
 _spam_screening = SpamScreeningService
+_SECRET_HEADER = "x-telegram-bot-api-secret-token"
+# Static "this bot only works in groups" reply, rendered once per language at init.
+_PRIVATE_CHAT_REPLIES = {lang: get_translated_text("private_message", lang) for lang in TRANSLATIONS}
+
+
+def _private_chat_reply(lang: str) -> str:
+    """Same fallback as ``get_translated_text``: unknown languages get DEFAULT_LANG."""
+    return _PRIVATE_CHAT_REPLIES.get(lang) or _PRIVATE_CHAT_REPLIES[DEFAULT_LANG]
 
 
 # ── Public entry point (called by main.lambda_handler) ──────────────────────
@@ -38,7 +49,7 @@ def handle_event(
 
     if event_type == "api_gateway":
         return _handle_api_gateway(event, dispatcher, bot)
-    logger.warning("Unknown event type received", extra={"event": event})
+    logger.warning("Unknown event type received", extra=api_gateway_event_summary(event))
 
     return None
 
@@ -64,37 +75,34 @@ def _handle_api_gateway(
     bot: TelegramClient,
 ) -> dict[str, Any]:
     """Synchronous webhook handler: validate -> process -> return 200 OK."""
-    screener = _spam_screening(bot, _sqs_client)
     try:
         if not verify_webhook_secret_token(event):
-            return create_response(200, {"ok": False, "error": "Unauthorized"})
+            return _RESPONSE_UNAUTHORIZED
 
         try:
             body = parse_api_gateway_event(event)
             logger.info("API Gateway event parsed successfully")
         except ValueError as e:
             logger.error("Failed to parse API Gateway event", extra={"error": e})
-            return create_response(200, {"message": "Invalid request"})
+            return _RESPONSE_INVALID
 
         chat_id, chat_type = _extract_chat_context(body)
 
         if chat_type == "private":
-            dispatcher.bot.send_message(
-                chat_id,
-                get_translated_text("private_message", get_chat_lang(chat_id)),
-            )
-            return create_response(200, {"message": "ok"})
+            dispatcher.bot.send_message(chat_id, _private_chat_reply(get_chat_lang(chat_id)))
+            return _RESPONSE_OK
 
         if chat_type in {"group", "supergroup"} and not is_configured_group_chat(chat_id):
             logger.debug("Silently ignoring event from non-whitelisted chat", extra={"chat_id": chat_id})
-            return create_response(200, {"message": "ok"})
+            return _RESPONSE_OK
 
-        if screener.should_screen(body):
-            screener.run(body)
+        # should_screen is static: unauthorized, private and most updates never build a screener.
+        if _spam_screening.should_screen(body):
+            _spam_screening(bot, _sqs_client).run(body)
 
         if not is_event_relevant_to_bot(body):
             logger.info("Event not relevant to bot, ignoring")
-            return create_response(200, {"message": "Not relevant"})
+            return _RESPONSE_NOT_RELEVANT
 
         if body.get("task_type") == "CHECK_TIMEOUT":
             body["_captcha_repo"] = dispatcher.captcha_repo
@@ -105,7 +113,7 @@ def _handle_api_gateway(
     except Exception as e:
         logger.exception("Unexpected error in webhook handler", extra={"error": e})
 
-    return create_response(200, {"message": "Webhook received"})
+    return _RESPONSE_RECEIVED
 
 
 # ── HTTP / webhook utilities ────────────────────────────────────────────
@@ -113,14 +121,20 @@ def _handle_api_gateway(
 
 def verify_webhook_secret_token(event: dict[str, Any]) -> bool:
     """Verify Telegram webhook secret token (constant-time comparison)."""
-    headers = event.get("headers", {})
-    received_token = headers.get("x-telegram-bot-api-secret-token") or headers.get("X-Telegram-Bot-Api-Secret-Token")
+    headers = event.get("headers") or {}
+    # HTTP API (payload 2.0) lowercases header names, so one lookup is the normal path.
+    received_token = headers.get(_SECRET_HEADER)
+    if received_token is None:
+        received_token = next((v for k, v in headers.items() if k.lower() == _SECRET_HEADER), None)
 
     if not received_token:
         logger.critical("Missing X-Telegram-Bot-Api-Secret-Token header")
         return False
 
-    if not hmac.compare_digest(received_token, get_webhook_secret_token()):
+    # bytes on both sides: compare_digest rejects non-ASCII str, which an attacker controls here. The secret
+    # itself is resolved once per container by the cached config getter.
+    expected = get_webhook_secret_token().encode("utf-8")
+    if not hmac.compare_digest(received_token.encode("utf-8"), expected):
         logger.critical("Webhook secret token mismatch")
         return False
 
@@ -135,9 +149,10 @@ def parse_api_gateway_event(event: dict[str, Any]) -> dict[str, Any]:
         raise ValueError("Missing body in API Gateway event")
 
     if event.get("isBase64Encoded", False):
-        body = base64.b64decode(body).decode("utf-8")
+        # json.loads takes the UTF-8 bytes directly; no intermediate str copy of the whole update.
+        body = base64.b64decode(body)
 
-    if isinstance(body, str):
+    if isinstance(body, (str, bytes)):
         try:
             return json.loads(body)
         except json.JSONDecodeError as e:
@@ -152,10 +167,19 @@ def create_response(status_code: int, body: dict[str, Any]) -> dict[str, Any]:
     return {
         "statusCode": status_code,
         "headers": {"Content-Type": "application/json"},
-        "body": json.dumps(body),
+        "body": dumps_compact(body),
     }
 
 
+# Every webhook reply is one of these fixed bodies: serialize them once at import.
+# Shared across invocations, so callers must treat them as read-only.
+_RESPONSE_UNAUTHORIZED = create_response(200, {"ok": False, "error": "Unauthorized"})
+_RESPONSE_INVALID = create_response(200, {"message": "Invalid request"})
+_RESPONSE_OK = create_response(200, {"message": "ok"})
+_RESPONSE_NOT_RELEVANT = create_response(200, {"message": "Not relevant"})
+_RESPONSE_RECEIVED = create_response(200, {"message": "Webhook received"})
+
+
 def _extract_chat_context(body: dict[str, Any]) -> tuple[int | None, str | None]:
     """Extract (chat_id, chat_type) from common Telegram update shapes."""
     message = body.get("message") or body.get("edited_message")
@@ -174,20 +198,16 @@ def _extract_chat_context(body: dict[str, Any]) -> tuple[int | None, str | None]
 
 def is_event_relevant_to_bot(body: dict[str, Any]) -> bool:
     """Return True if the Telegram update warrants processing."""
-    if "poll_answer" in body:
+    if "poll_answer" in body or "callback_query" in body:
         return True
 
-    if "callback_query" in body:
-        return True
-
-    if "message" in body:
-        msg = body["message"]
-        if "new_chat_members" in msg:
-            return True
-        if msg.get("document"):
+    msg = body.get("message")
+    if msg is not None:
+        if "new_chat_members" in msg or msg.get("document"):
             return True
-        text_content = msg.get("text") or ""
-        if text_content.strip():
+        # isspace() answers "blank?" without strip() allocating a copy of the text.
+        text_content = msg.get("text")
+        if text_content and not text_content.isspace():
             return True
 
     return False
@@ -35,6 +35,23 @@ def _map_gemini_api_error(exc: genai_errors.APIError) -> ZerdeProviderError:
     return ProviderResponseError(str(exc))
 
 
+def _valid_top_indices(indices: Any, pool_size: int, limit: int = 3) -> list[int]:
+    """Keep the first ``limit`` distinct in-range integer indices, in model order (single pass)."""
+    result: list[int] = []
+    seen: set[int] = set()
+    for raw in indices if isinstance(indices, list) else []:
+        try:
+            idx = int(raw)
+        except (TypeError, ValueError):
+            continue
+        if 0 <= idx < pool_size and idx not in seen:
+            seen.add(idx)
+            result.append(idx)
+            if len(result) == limit:
+                break
+    return result
+
+
 _TOP_NEWS_RESPONSE_SCHEMA: dict[str, Any] = {
     "type": "object",
     "properties": {
@@ -109,7 +126,7 @@ class NewsAIClientBase(ABC):
                 response_json_schema=_TOP_NEWS_RESPONSE_SCHEMA,
             )
             indices = data.get("top_indices", [0, 1, 2])
-            result = [int(i) for i in indices if 0 <= int(i) < len(news_items)][:3]
+            result = _valid_top_indices(indices, len(news_items))
             logger.info("Top news selected", extra={"indices": result, "pool_size": len(news_items)})
             return result
         except ZerdeProviderError:
@@ -202,6 +219,8 @@ class GeminiNewsClient(NewsAIClientBase):
     def __init__(self, api_key: str, model: str) -> None:
         self._client = genai.Client(api_key=api_key)
         self._model = model
+        # Depends only on the model name, so build it once per container rather than per attempt.
+        self._thinking = self._thinking_config()
         logger.info("GeminiNewsClient initialized", extra={"model": model})
 
     def _generate(
@@ -214,7 +233,6 @@ class GeminiNewsClient(NewsAIClientBase):
         has_schema = response_json_schema is not None
         for attempt, delay in enumerate(self._RETRY_DELAYS):
             try:
-                thinking_config = self._thinking_config()
                 config_kwargs: dict[str, Any] = {
                     "temperature": temperature,
                     "response_mime_type": "application/json",
@@ -222,8 +240,8 @@ class GeminiNewsClient(NewsAIClientBase):
                 }
                 if response_json_schema is not None:
                     config_kwargs["response_json_schema"] = response_json_schema
-                if thinking_config is not None:
-                    config_kwargs["thinking_config"] = thinking_config
+                if self._thinking is not None:
+                    config_kwargs["thinking_config"] = self._thinking
 
                 logger.info(
                     "Gemini news request started",
@@ -233,7 +251,7 @@ class GeminiNewsClient(NewsAIClientBase):
                         "temperature": temperature,
                         "max_output_tokens": max_output_tokens,
                         "response_json_schema": has_schema,
-                        "thinking_config": self._thinking_config_name(thinking_config),
+                        "thinking_config": self._thinking_config_name(self._thinking),
                     },
                 )
                 response = self._client.models.generate_content(
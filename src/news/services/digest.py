@@ -1,5 +1,6 @@
 """DigestService: orchestrates the full news digest pipeline."""
 
+import concurrent.futures
 from typing import Any
 
 from core.logger import LoggerAdapter, get_logger
@@ -10,6 +11,8 @@ from services.telegram import TelegramSender
 
 logger = LoggerAdapter(get_logger(__name__), {})
 
+_MAX_SCRAPE_WORKERS = 8
+
 
 class DigestService:
     """Full news digest pipeline: fetch → AI select → deep scrape → generate → send."""
@@ -35,6 +38,20 @@ class DigestService:
                     extra={"chat_id": chat_id},
                 )
 
+    def _deep_scrape(self, articles: list[dict]) -> list[dict]:
+        """Enrich articles with image/full text; pages are scraped concurrently, order is kept."""
+        if not articles:
+            return []
+
+        def scrape(article: dict) -> dict:
+            logger.debug("Fetching deep article data", extra={"link": article.get("link")})
+            article.update(self._fetcher.fetch_deep_article_data(article["link"]))
+            return article
+
+        workers = min(_MAX_SCRAPE_WORKERS, len(articles))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(scrape, articles))
+
     def run(self, event: dict[str, Any]) -> dict[str, Any]:
         """Execute the digest pipeline for a language group.
 
@@ -56,17 +73,7 @@ class DigestService:
                 extra={"indices": top_indices, "count": len(top_indices)},
             )
 
-            deep_news: list[dict] = []
-            for idx in top_indices:
-                article = raw_news[idx]
-                logger.debug(
-                    "Fetching deep article data",
-                    extra={"index": idx, "link": article.get("link")},
-                )
-                deep_data = self._fetcher.fetch_deep_article_data(article["link"])
-                article.update(deep_data)
-                deep_news.append(article)
-
+            deep_news = self._deep_scrape([raw_news[idx] for idx in top_indices])
             logger.info("Deep scrape complete", extra={"articles": len(deep_news)})
 
             intro = get_intro_text(lang)
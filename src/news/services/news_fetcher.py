@@ -2,18 +2,145 @@
 
 import concurrent.futures
 import html
+import io
 import re
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from email.utils import parsedate_to_datetime
 from typing import Optional
 
-import feedparser
 import urllib3
 from core.logger import LoggerAdapter, get_logger
 
 logger = LoggerAdapter(get_logger(__name__), {})
 
-http = urllib3.PoolManager(timeout=urllib3.Timeout(total=10))
+# One pool per RSS host plus article hosts, so warm invocations keep their TLS connections.
+http = urllib3.PoolManager(num_pools=32, timeout=urllib3.Timeout(total=10))
+
+_ENTRY_TAGS: frozenset[str] = frozenset({"item", "entry"})
+_SUMMARY_TAGS: frozenset[str] = frozenset({"description", "summary"})
+# Full body tags, matched by qualified name: a bare "content" local name would also catch ``media:content``
+# (an empty element carrying only a url) and hide the real body, which feedparser never does.
+_CONTENT_TAGS: frozenset[str] = frozenset(
+    {
+        "{http://purl.org/rss/1.0/modules/content/}encoded",  # RSS content:encoded
+        "{http://www.w3.org/2005/Atom}content",
+        "{http://purl.org/atom/ns#}content",  # Atom 0.3
+    }
+)
+# Same precedence as feedparser's published → updated fallback (RSS, Atom, Dublin Core).
+_DATE_TAGS: tuple[str, ...] = ("pubDate", "published", "issued", "updated", "date", "modified", "lastmod")
+
+# Deep-scrape patterns, compiled once per container. Image: og:image / twitter:image, then first content img.
+_IMAGE_PATTERNS: tuple[re.Pattern[str], ...] = tuple(
+    re.compile(p, re.IGNORECASE)
+    for p in (
+        r'<meta\s+property=["\']og:image["\']\s+content=["\']([^"\']+)["\']',
+        r'<meta\s+content=["\']([^"\']+)["\']\s+property=["\']og:image["\']',
+        r'<meta\s+name=["\']twitter:image["\']\s+content=["\']([^"\']+)["\']',
+        r'<img[^>]+src=["\'](https?://[^"\']+(?:jpg|jpeg|png|webp))["\']',
+    )
+)
+_PARAGRAPH_RE = re.compile(r"<p[^>]*>(.*?)</p>", re.IGNORECASE | re.DOTALL)
+_TAG_RE = re.compile(r"<[^>]+>")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Every pooled entry goes into the select_top_news prompt; keep it to the text the model needs.
+_MAX_TITLE_CHARS = 200
+_MAX_SUMMARY_CHARS = 250
+
+
+@dataclass
+class _FeedCacheEntry:
+    """Validators and parsed entries of the last successful fetch of one feed."""
+
+    etag: str | None
+    last_modified: str | None
+    entries: list[dict]
+
+
+# Per-feed cache shared across warm invocations (the kk/zh/ru digests run minutes apart).
+_feed_cache: dict[str, _FeedCacheEntry] = {}
+
+
+def _plain_text(markup: str, max_chars: int) -> str:
+    """Strip tags/entities and collapse whitespace so the char budget is spent on words, not markup."""
+    text = html.unescape(_TAG_RE.sub(" ", markup)) if "<" in markup or "&" in markup else markup
+    return _WHITESPACE_RE.sub(" ", text).strip()[:max_chars]
+
+
+def _local_name(tag: str) -> str:
+    """Strip the ``{namespace}`` prefix ElementTree puts on qualified tag names."""
+    return tag.rpartition("}")[2]
+
+
+def _parse_feed_xml(data: bytes) -> list[dict[str, str]]:
+    """Stream-parse an RSS/Atom document keeping only title, link, summary and date per entry.
+
+    Raises ``ET.ParseError`` on malformed XML so the caller can fall back to feedparser.
+    """
+    entries: list[dict[str, str]] = []
+    for _, elem in ET.iterparse(io.BytesIO(data), events=("end",)):
+        if _local_name(elem.tag) not in _ENTRY_TAGS:
+            continue
+        fields: dict[str, str] = {}
+        dates: dict[str, str] = {}
+        for child in elem:
+            name = _local_name(child.tag)
+            if name == "link":
+                href = child.get("href")
+                if href is None:
+                    fields.setdefault("link", (child.text or "").strip())
+                elif child.get("rel", "alternate") == "alternate":
+                    fields.setdefault("link", href.strip())
+            elif name == "title":
+                title = "".join(child.itertext()).strip()
+                # Atom ``type="html"`` titles arrive entity-escaped; feedparser unescapes them too.
+                fields.setdefault("title", html.unescape(title) if child.get("type") == "html" else title)
+            elif name in _SUMMARY_TAGS:
+                fields.setdefault("summary", "".join(child.itertext()).strip())
+            elif child.tag in _CONTENT_TAGS:
+                content = "".join(child.itertext()).strip()
+                if content:
+                    fields.setdefault("content", content)
+            elif name in _DATE_TAGS and child.text:
+                dates.setdefault(name, child.text.strip())
+        entries.append(
+            {
+                "title": fields.get("title") or "No title",
+                "link": fields.get("link", ""),
+                "summary": fields.get("summary") or fields.get("content", ""),
+                "date": next((dates[t] for t in _DATE_TAGS if t in dates), ""),
+            }
+        )
+        elem.clear()
+    return entries
+
+
+def _parse_feed_with_feedparser(data: bytes) -> list[dict[str, str]]:
+    """Lenient fallback for feeds ElementTree rejects (bad entities, broken markup)."""
+    # Late import: feedparser is only needed for the rare malformed feed, keep it off cold start.
+    import feedparser
+
+    # Summaries are trimmed to 250 chars and only ever fed to the LLM; skip feedparser's regex-heavy
+    # HTML sanitizer and URI rewriting, matching what the ElementTree path returns.
+    feed = feedparser.parse(data, sanitize_html=False, resolve_relative_uris=False)
+    return [
+        {
+            "title": entry.get("title", "No title"),
+            "link": entry.get("link", ""),
+            "summary": entry.get("summary", ""),
+            "date": (
+                entry.get("published")
+                or entry.get("updated")
+                or entry.get("lastmod")
+                or entry.get("news_publication_date")
+                or ""
+            ),
+        }
+        for entry in feed.entries
+    ]
 
 
 class NewsFetcher:
@@ -24,7 +151,7 @@ class NewsFetcher:
     by publish date (max_age_hours) to ensure only fresh content.
     """
 
-    RSS_FEEDS = [
+    RSS_FEEDS = (
         # --- TIER 1: Macro-economy, Big Tech, Investments ---
         "https://search.cnbc.com/rs/search/combinedcms/view.xml?partnerId=wrss01&id=19854910",
         "https://techcrunch.com/feed/",
@@ -46,7 +173,7 @@ class NewsFetcher:
         "https://profit.kz/rss/news/",
         "https://digitalbusiness.kz/feed/",
         "https://tproger.ru/feed/",
-    ]
+    )
 
     def fetch_raw_news(self, max_age_hours: int = 24) -> list[dict]:
         """Fetch raw news pool from RSS."""
@@ -54,35 +181,16 @@ class NewsFetcher:
         cutoff_time = datetime.now(timezone.utc) - timedelta(hours=max_age_hours)
 
         def fetch_single_feed(feed_url: str) -> list[dict]:
-            local_news = []
             try:
-                resp = http.request("GET", feed_url, timeout=10)
-                feed = feedparser.parse(resp.data)
-                logger.debug("Feed parsed", extra={"entries": len(feed.entries)})
-                for entry in feed.entries:
-                    pub_date_str = (
-                        entry.get("published")
-                        or entry.get("updated")
-                        or entry.get("lastmod")
-                        or entry.get("news_publication_date")
-                    )
-                    pub_date = self._parse_date(pub_date_str)
-                    if pub_date is None or pub_date < cutoff_time:
-                        continue
-                    local_news.append(
-                        {
-                            "title": entry.get("title", "No title"),
-                            "link": entry.get("link", ""),
-                            "summary": entry.get("summary", "")[:250],
-                        }
-                    )
-                    # logger.debug(
-                    #     "News item added",
-                    #     extra={"title": entry.get("title", "No title"), "link": entry.get("link", "")},
-                    # )
+                entries = self._fetch_feed_entries(feed_url)
             except Exception as e:
                 logger.warning("Feed fetch failed", extra={"feed_url": feed_url, "error": str(e)})
-            return local_news
+                return []
+            return [
+                {"title": e["title"], "link": e["link"], "summary": e["summary"]}
+                for e in entries
+                if e["published_at"] >= cutoff_time
+            ]
 
         with concurrent.futures.ThreadPoolExecutor(max_workers=len(self.RSS_FEEDS)) as executor:
             results = executor.map(fetch_single_feed, self.RSS_FEEDS)
@@ -95,6 +203,51 @@ class NewsFetcher:
         logger.info("Raw news pool fetched", extra={"count": len(raw_news), "feeds": len(self.RSS_FEEDS)})
         return raw_news
 
+    def _fetch_feed_entries(self, feed_url: str) -> list[dict]:
+        """Return dated entries for one feed, revalidating the warm-container cache with a conditional GET."""
+        cached = _feed_cache.get(feed_url)
+        headers: dict[str, str] = {}
+        if cached is not None:
+            if cached.etag:
+                headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                headers["If-Modified-Since"] = cached.last_modified
+
+        resp = http.request("GET", feed_url, headers=headers, timeout=10)
+        if resp.status == 304 and cached is not None:
+            logger.debug("Feed not modified; reusing cached entries", extra={"feed_url": feed_url})
+            return cached.entries
+        if resp.status >= 400:
+            logger.warning("Feed HTTP error", extra={"feed_url": feed_url, "status": resp.status})
+            return []
+
+        try:
+            parsed = _parse_feed_xml(resp.data)
+        except ET.ParseError:
+            logger.debug("Feed is not well-formed XML; using feedparser", extra={"feed_url": feed_url})
+            parsed = _parse_feed_with_feedparser(resp.data)
+        logger.debug("Feed parsed", extra={"entries": len(parsed)})
+        entries: list[dict] = []
+        for entry in parsed:
+            pub_date = self._parse_date(entry["date"])
+            if pub_date is None:
+                continue
+            entries.append(
+                {
+                    "title": entry["title"][:_MAX_TITLE_CHARS],
+                    "link": entry["link"],
+                    "summary": _plain_text(entry["summary"], _MAX_SUMMARY_CHARS),
+                    "published_at": pub_date,
+                }
+            )
+
+        _feed_cache[feed_url] = _FeedCacheEntry(
+            etag=resp.headers.get("ETag"),
+            last_modified=resp.headers.get("Last-Modified"),
+            entries=entries,
+        )
+        return entries
+
     def fetch_deep_article_data(self, url: str) -> dict:
         """Scrape the article page for og:image (or first img) and main paragraph text."""
         headers = {
@@ -111,15 +264,8 @@ class NewsFetcher:
             html_content = resp.data.decode("utf-8")
             image_url = ""
 
-            # Prefer og:image / twitter:image, then first content img
-            patterns = [
-                r'<meta\s+property=["\']og:image["\']\s+content=["\']([^"\']+)["\']',
-                r'<meta\s+content=["\']([^"\']+)["\']\s+property=["\']og:image["\']',
-                r'<meta\s+name=["\']twitter:image["\']\s+content=["\']([^"\']+)["\']',
-                r'<img[^>]+src=["\'](https?://[^"\']+(?:jpg|jpeg|png|webp))["\']',
-            ]
-            for pattern in patterns:
-                match = re.search(pattern, html_content, re.IGNORECASE)
+            for pattern in _IMAGE_PATTERNS:
+                match = pattern.search(html_content)
                 if match:
                     extracted_url = match.group(1).strip()
                     extracted_url = html.unescape(extracted_url)
@@ -128,8 +274,8 @@ class NewsFetcher:
                         image_url = extracted_url
                         break
 
-            p_tags = re.findall(r"<p[^>]*>(.*?)</p>", html_content, re.IGNORECASE | re.DOTALL)
-            clean_text = " ".join([re.sub(r"<[^>]+>", "", p).strip() for p in p_tags if len(p) > 50])
+            p_tags = _PARAGRAPH_RE.findall(html_content)
+            clean_text = " ".join([_TAG_RE.sub("", p).strip() for p in p_tags if len(p) > 50])
             full_text = clean_text[:3000]
             logger.debug("Deep scrape success", extra={"url": url, "image_found": image_url})
             return {"image_url": image_url, "full_text": full_text}
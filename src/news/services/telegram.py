@@ -8,6 +8,7 @@ from typing import Optional
 import urllib3
 from core.logger import LoggerAdapter, get_logger
 from zerde_common.logging_utils import truncate_log_text
+from zerde_common.retry import full_jitter_backoff
 
 logger = LoggerAdapter(get_logger(__name__), {})
 
@@ -15,21 +16,32 @@ TELEGRAM_MAX_LENGTH = 4096
 TELEGRAM_CAPTION_MAX_LENGTH = 1024
 
 _JSON_HEADERS = {"Content-Type": "application/json"}
-http = urllib3.PoolManager(maxsize=4, timeout=urllib3.Timeout(total=10))
+# Module scope so warm invocations and retries reuse the kept-alive TLS socket to api.telegram.org.
+http = urllib3.PoolManager(maxsize=4, timeout=urllib3.Timeout(connect=3.05, read=7))
+
+_BACKOFF_CAP_SECONDS = 2.0
+
+
+def _backoff_delay(attempt: int) -> float:
+    return full_jitter_backoff(attempt, _BACKOFF_CAP_SECONDS)
+
+
+_BARE_AMPERSAND = re.compile(r"&(?!\w+;|#[0-9]+;|#x[0-9a-fA-F]+;)")
+_ANGLE_ESCAPES = str.maketrans({"<": "&lt;", ">": "&gt;"})
+_ALLOWED_TAG = re.compile(r'&lt;(?:(/?b|/?blockquote|/a)|a\s+href="([^"]*)")&gt;')
+
+
+def _restore_tag(match: re.Match[str]) -> str:
+    tag, href = match.groups()
+    return f"<{tag}>" if tag else f'<a href="{href}">'
 
 
 def sanitize_html(text: str) -> str:
     """Sanitize text for Telegram HTML parse mode without double-escaping."""
     if not text:
         return ""
-    text = re.sub(r"&(?!\w+;|#[0-9]+;|#x[0-9a-fA-F]+;)", "&amp;", text)
-    text = text.replace("<", "&lt;")
-    text = text.replace(">", "&gt;")
-    for tag in ["b", "/b", "blockquote", "/blockquote"]:
-        text = text.replace(f"&lt;{tag}&gt;", f"<{tag}>")
-    text = re.sub(r"&lt;a\s+href=\"([^\"]*)\"&gt;", r'<a href="\1">', text)
-    text = text.replace("&lt;/a&gt;", "</a>")
-    return text
+    text = _BARE_AMPERSAND.sub("&amp;", text).translate(_ANGLE_ESCAPES)
+    return _ALLOWED_TAG.sub(_restore_tag, text)
 
 
 def truncate_message(text: str, max_length: int = TELEGRAM_MAX_LENGTH) -> str:
@@ -80,7 +92,7 @@ class TelegramSender:
                 )
 
                 if status_code == 429:
-                    retry_delay = 2 ** (attempt + 1)
+                    retry_delay = _backoff_delay(attempt)
                     try:
                         resp_json = json.loads(response_text)
                         retry_after = resp_json.get("parameters", {}).get("retry_after")
@@ -91,7 +103,7 @@ class TelegramSender:
                     if attempt == max_retries - 1:
                         logger.error(f"Rate limited (429) for {chat_id}, max retries reached")
                         return False, status_code
-                    logger.warning(f"Rate limited, sleeping for {retry_delay}s")
+                    logger.warning(f"Rate limited, sleeping for {retry_delay:.1f}s")
                     time.sleep(retry_delay)
                     continue
 
@@ -102,7 +114,7 @@ class TelegramSender:
                 if attempt == max_retries - 1:
                     logger.error(f"Failed to send to {chat_id} after {max_retries} attempts")
                     return False, status_code
-                time.sleep(2 ** (attempt + 1))
+                time.sleep(_backoff_delay(attempt))
 
             except Exception as e:
                 error_type = type(e).__name__
@@ -110,7 +122,7 @@ class TelegramSender:
                 if attempt == max_retries - 1:
                     logger.error(f"Failed to send to {chat_id} after {max_retries} attempts")
                     return False, None
-                time.sleep(2 ** (attempt + 1))
+                time.sleep(_backoff_delay(attempt))
         return False, None
 
     def send_message_with_photo(
@@ -132,9 +144,11 @@ class TelegramSender:
             "parse_mode": "HTML",
             "disable_web_page_preview": True,
         }
+        body_bytes = json.dumps(payload).encode("utf-8")
+
         for attempt in range(2):
             try:
-                resp = http.request("POST", url, body=json.dumps(payload), headers=_JSON_HEADERS)
+                resp = http.request("POST", url, body=body_bytes, headers=_JSON_HEADERS)
                 if resp.status < 400:
                     logger.info("Photo sent", extra={"chat_id": chat_id})
                     return True
@@ -149,14 +163,14 @@ class TelegramSender:
                     },
                 )
                 if attempt == 0:
-                    time.sleep(1.5)
+                    time.sleep(_backoff_delay(attempt + 1))
             except Exception as e:
                 logger.error(
                     "Failed to send photo (network)",
                     extra={"chat_id": chat_id, "error": str(e), "attempt": attempt + 1},
                 )
                 if attempt == 0:
-                    time.sleep(1.5)
+                    time.sleep(_backoff_delay(attempt + 1))
         text_ok, _ = self.send_message(chat_id, message)
         if text_ok:
             logger.warning("Fell back to text-only after photo send failure", extra={"chat_id": chat_id})
@@ -99,7 +99,7 @@ def get_translated_text(key: str, lang_code: str = "kk", **kwargs: Any) -> str:
 
     try:
         if kwargs:
-            text = text.format(**kwargs)
+            text = text.format_map(kwargs)  # kwargs is already a dict: no ** re-pack per call
     except KeyError as e:
         logger.warning("Missing format key in translation", extra={"error": str(e), "key": key})
 
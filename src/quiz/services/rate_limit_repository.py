@@ -3,10 +3,10 @@
 from datetime import datetime, timedelta
 from zoneinfo import ZoneInfo
 
-import boto3
 from botocore.exceptions import ClientError
 from core.config import QUIZ_LLM_RPD, TABLE_NAME
 from core.logger import LoggerAdapter, get_logger
+from services.repository import get_dynamodb
 
 logger = LoggerAdapter(get_logger(__name__), {})
 
@@ -19,7 +19,7 @@ class QuizRateLimitRepository:
     """DynamoDB-backed daily counter for quiz Gemini requests."""
 
     def __init__(self) -> None:
-        self._table = boto3.resource("dynamodb").Table(TABLE_NAME)
+        self._table = get_dynamodb().Table(TABLE_NAME)
         self.rpd_limit: int = QUIZ_LLM_RPD
         logger.info(
             "QuizRateLimitRepository initialized",
@@ -1,11 +1,13 @@
 """DynamoDB repository for Quiz Lambda — writes quiz records and category metadata."""
 
+import heapq
 import time
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
 import boto3
 from boto3.dynamodb.conditions import Key
+from botocore.config import Config
 from core.config import TABLE_NAME
 from core.logger import LoggerAdapter, get_logger
 
@@ -14,12 +16,29 @@ logger = LoggerAdapter(get_logger(__name__), {})
 _ALMATY_TZ = timezone(timedelta(hours=5))
 _TTL_DAYS = 90
 
+# One resource (one connection pool) for both quiz repositories; keepalive holds the socket between calls.
+_DYNAMODB_CONFIG = Config(
+    connect_timeout=1,
+    read_timeout=3,
+    retries={"mode": "adaptive", "max_attempts": 3},
+    tcp_keepalive=True,
+)
+_dynamodb_resource = None
+
+
+def get_dynamodb():
+    """Return the shared boto3 DynamoDB resource for the Quiz Lambda, creating it lazily."""
+    global _dynamodb_resource
+    if _dynamodb_resource is None:
+        _dynamodb_resource = boto3.resource("dynamodb", config=_DYNAMODB_CONFIG)
+    return _dynamodb_resource
+
 
 class QuizRepository:
     """Writes daily quiz records and category metadata to DynamoDB."""
 
     def __init__(self) -> None:
-        self._table = boto3.resource("dynamodb").Table(TABLE_NAME)
+        self._table = get_dynamodb().Table(TABLE_NAME)
         logger.info("QuizRepository initialized", extra={"table": TABLE_NAME})
 
     def get_category_queue(self, chat_id: str) -> list[str]:
@@ -70,8 +89,7 @@ class QuizRepository:
         """Return top N users for a chat sorted by week_score descending."""
         try:
             items = self._query_all_pages(chat_id)
-            sorted_items = sorted(items, key=lambda x: x.get("week_score", 0), reverse=True)
-            return sorted_items[:limit]
+            return heapq.nlargest(limit, items, key=lambda x: x.get("week_score", 0))
         except Exception as e:
             logger.error("Failed to get leaderboard", extra={"chat_id": chat_id, "error": str(e)})
             return []
@@ -143,7 +161,7 @@ class QuizRepository:
         try:
             items = self._query_all_pages(chat_id)
             active = [i for i in items if int(i.get("season_wins", 0)) > 0]
-            return sorted(active, key=lambda x: int(x.get("season_wins", 0)), reverse=True)[:limit]
+            return heapq.nlargest(limit, active, key=lambda x: int(x.get("season_wins", 0)))
         except Exception as e:
             logger.error("Failed to get season leaderboard", extra={"chat_id": chat_id, "error": str(e)})
             return []
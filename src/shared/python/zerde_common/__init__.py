@@ -1,4 +1,4 @@
-"""Shared Lambda Layer utilities: typed env, secrets, logging, AI errors.
+"""Shared Lambda Layer utilities: typed env, secrets, logging, JSON, retry timing, AI errors.
 
 Kept free of business/domain logic so bot, news, and quiz stay decoupled.
 """
@@ -11,11 +11,13 @@ from zerde_common.ai_errors import (
     map_http_status_to_provider_error,
 )
 from zerde_common.config import require, require_int, require_json
+from zerde_common.json_utils import dumps_compact, dumps_utf8
 from zerde_common.logging_utils import (
     api_gateway_event_summary,
     llm_text_log_fields,
     truncate_log_text,
 )
+from zerde_common.retry import full_jitter_backoff
 from zerde_common.secrets import load_ssm_secrets_if_needed
 
 __all__ = [
@@ -25,6 +27,9 @@ __all__ = [
     "ZerdeProviderError",
     "map_http_status_to_provider_error",
     "api_gateway_event_summary",
+    "dumps_compact",
+    "dumps_utf8",
+    "full_jitter_backoff",
     "llm_text_log_fields",
     "load_ssm_secrets_if_needed",
     "require",
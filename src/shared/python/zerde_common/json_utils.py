@@ -0,0 +1,23 @@
+"""Compact JSON encoding for Lambda hot paths (stdlib C encoder; the layer ships no third-party deps)."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+# Pre-built encoders: json.dumps() constructs a fresh JSONEncoder on every call that passes options.
+_COMPACT = json.JSONEncoder(separators=(",", ":"))
+_COMPACT_UNICODE = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+
+def dumps_compact(obj: Any) -> str:
+    """ASCII-safe compact JSON text (SQS message bodies, API Gateway responses)."""
+    return _COMPACT.encode(obj)
+
+
+def dumps_utf8(obj: Any) -> bytes:
+    """Compact UTF-8 JSON bytes for HTTP bodies; Cyrillic/CJK text stays 2–3 bytes/char instead of 6."""
+    try:
+        return _COMPACT_UNICODE.encode(obj).encode("utf-8")
+    except UnicodeEncodeError:  # lone surrogate in user text: keep it \u-escaped
+        return _COMPACT.encode(obj).encode("ascii")
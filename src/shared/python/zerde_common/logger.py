@@ -6,15 +6,31 @@ import json
 import logging
 from typing import Any
 
+# json.dumps(..., default=str, ensure_ascii=False) would build a new JSONEncoder for every log line.
+_LOG_ENCODER = json.JSONEncoder(default=str, ensure_ascii=False)
+
 
 class JSONFormatter(logging.Formatter):
     """Format log records as single-line JSON for CloudWatch."""
 
+    def __init__(self) -> None:
+        super().__init__()
+        self._ts_second = -1
+        self._ts_text = ""
+
+    def _timestamp(self, record: logging.LogRecord) -> str:
+        """Second-resolution timestamp, formatted once per second rather than per record."""
+        second = int(record.created)
+        if second != self._ts_second:
+            self._ts_text = self.formatTime(record, datefmt="%Y-%m-%dT%H:%M:%S")
+            self._ts_second = second
+        return self._ts_text
+
     def format(self, record: logging.LogRecord) -> str:
         log_entry: dict = {
             "level": record.levelname,
             "message": record.getMessage(),
-            "timestamp": self.formatTime(record, datefmt="%Y-%m-%dT%H:%M:%S"),
+            "timestamp": self._timestamp(record),
             "location": f"{record.module}.{record.funcName}",
         }
         if record.exc_info and record.exc_info[0] is not None:
@@ -22,7 +38,7 @@ class JSONFormatter(logging.Formatter):
         extra = getattr(record, "_extra", None)
         if extra:
             log_entry.update(extra)
-        return json.dumps(log_entry, default=str, ensure_ascii=False)
+        return _LOG_ENCODER.encode(log_entry)
 
 
 def get_json_logger(name: str, log_level: str) -> logging.Logger:
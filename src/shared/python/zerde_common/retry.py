@@ -0,0 +1,10 @@
+"""Retry timing shared by the bot and news Telegram clients."""
+
+from __future__ import annotations
+
+import random
+
+
+def full_jitter_backoff(attempt: int, cap: float) -> float:
+    """Full-jitter backoff: uniform in [0, min(2**attempt, cap)] so retries don't synchronize."""
+    return random.uniform(0, min(2**attempt, cap))
@@ -40,6 +40,26 @@ os.environ.setdefault("QUIZ_LAMBDA_NAME", "test-quiz-lambda")
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src", "bot"))
 
 
+@pytest.fixture(autouse=True)
+def _clear_member_cache():
+    """Chat members are cached per process; don't let one test's mock status leak into the next."""
+    from services.spam.chat_member import clear_member_cache
+
+    clear_member_cache()
+    yield
+    clear_member_cache()
+
+
+@pytest.fixture(autouse=True)
+def _clear_processed_callbacks():
+    """Vote callback ids are remembered per process; each test starts from an empty set."""
+    from services.handlers.voteban import clear_processed_callbacks
+
+    clear_processed_callbacks()
+    yield
+    clear_processed_callbacks()
+
+
 @pytest.fixture
 def mock_bot():
     """Mock TelegramClient with all methods stubbed."""
@@ -50,6 +70,7 @@ def mock_bot():
     bot.restrict_chat_member.return_value = None
     bot.kick_chat_member.return_value = None
     bot.delete_message.return_value = None
+    bot.delete_messages.return_value = None
     bot.edit_message_text.return_value = {}
     return bot
 
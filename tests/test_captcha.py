@@ -37,6 +37,8 @@ def test_correct_answer_unrestricts_user():
 
     ctx.bot.restrict_chat_member.assert_called_once()
     captcha_repo.delete_pending.assert_called_once_with(-100123, 42)
+    # Captcha image + the user's answer go in one deleteMessages call; the join message stays.
+    ctx.bot.delete_messages_async.assert_called_once_with(-100123, [6, ctx.message_id])
 
 
 def test_wrong_answer_increments_attempts():
@@ -79,6 +81,74 @@ def test_third_wrong_answer_kicks_user():
 
     ctx.bot.kick_chat_member.assert_called_once_with(-100123, 42)
     captcha_repo.delete_pending.assert_called_once()
+    ctx.bot.delete_messages_async.assert_called_once_with(-100123, [5, 6, ctx.message_id])
+
+
+def test_non_digit_answer_deleted_in_background():
+    """Letters instead of digits: the message is deleted without counting an attempt."""
+    from services.handlers.captcha import handle_captcha_answer
+
+    captcha_repo = MagicMock()
+    captcha_repo.get_pending.return_value = {"expected": "3719", "join_msg_id": 5, "verify_msg_id": 6}
+
+    ctx = _make_ctx("hello", user_id=42, chat_id=-100123, captcha_repo=captcha_repo)
+    handle_captcha_answer(ctx)
+
+    ctx.bot.delete_message_async.assert_called_once_with(-100123, ctx.message_id)
+    ctx.bot.delete_message.assert_not_called()
+    captcha_repo.increment_attempts.assert_not_called()
+
+
+def test_timeout_for_departed_user_logs_without_traceback():
+    """kickChatMember 400 (user already left): state is cleaned up and no exception is logged."""
+    from unittest.mock import patch
+
+    from services.handlers import captcha
+    from services.telegram import TelegramAPIError
+
+    bot = MagicMock()
+    bot.kick_chat_member.side_effect = TelegramAPIError(400, '{"description": "Bad Request: user not found"}')
+    captcha_repo = MagicMock()
+    captcha_repo.get_pending.return_value = {"expected": "3719"}
+    task = {
+        "chat_id": -100123,
+        "user_id": 42,
+        "join_message_id": 5,
+        "verification_message_id": 6,
+        "_captcha_repo": captcha_repo,
+    }
+
+    with patch.object(captcha.logger, "exception") as log_exception:
+        captcha.process_timeout_task(bot, task)
+
+    log_exception.assert_not_called()
+    bot.delete_messages.assert_not_called()
+    captcha_repo.delete_pending.assert_called_once_with(-100123, 42)
+
+
+def test_timeout_throttled_kick_is_redelivered():
+    """kickChatMember still 429 after client retries: raise for SQS redelivery and keep the pending state."""
+    import pytest
+    from services.handlers import captcha
+    from services.telegram import TelegramAPIError
+
+    bot = MagicMock()
+    bot.kick_chat_member.side_effect = TelegramAPIError(429, '{"parameters": {"retry_after": 30}}')
+    captcha_repo = MagicMock()
+    captcha_repo.get_pending.return_value = {"expected": "3719"}
+    task = {
+        "chat_id": -100123,
+        "user_id": 42,
+        "join_message_id": 5,
+        "verification_message_id": 6,
+        "_captcha_repo": captcha_repo,
+    }
+
+    with pytest.raises(TelegramAPIError):
+        captcha.process_timeout_task(bot, task)
+
+    captcha_repo.delete_pending.assert_not_called()
+    captcha_repo.extend_pending.assert_called_once_with(-100123, 42, captcha._TIMEOUT_RETRY_TTL_SECONDS)
 
 
 def test_no_pending_captcha_ignored():
@@ -93,3 +163,98 @@ def test_no_pending_captcha_ignored():
 
     ctx.bot.restrict_chat_member.assert_not_called()
     ctx.bot.kick_chat_member.assert_not_called()
+
+
+def _photo_sender(results_by_user):
+    """send_photo fake keyed on the mentioned user; captcha photos are sent concurrently, so order varies."""
+
+    def send_photo(chat_id, image_bytes, caption):
+        for user_id, result in results_by_user.items():
+            if f"tg://user?id={user_id}" in caption:
+                if isinstance(result, Exception):
+                    raise result
+                return result
+        raise AssertionError(f"unexpected caption: {caption}")
+
+    return send_photo
+
+
+def test_new_members_timeouts_queued_in_one_batch():
+    """Several joiners in one update → one batched timeout enqueue and one joins increment."""
+    from unittest.mock import patch
+
+    from core.dispatcher import Context
+    from services.handlers.captcha import handle_new_member
+
+    update = {
+        "message": {
+            "message_id": 10,
+            "chat": {"id": -100123, "type": "supergroup"},
+            "from": {"id": 1, "first_name": "Adder", "language_code": "en"},
+            "new_chat_members": [
+                {"id": 42, "first_name": "A"},
+                {"id": 43, "first_name": "Bot", "is_bot": True},
+                {"id": 44, "first_name": "B"},
+            ],
+        }
+    }
+    bot = MagicMock()
+    bot.send_photo.side_effect = _photo_sender({42: {"message_id": 100}, 44: {"message_id": 101}})
+    stats_repo, sqs_repo = MagicMock(), MagicMock()
+    ctx = Context(update, bot, stats_repo=stats_repo, sqs_repo=sqs_repo, captcha_repo=MagicMock())
+
+    with patch("services.captcha_image.generate_grid_captcha", return_value=(b"png", "1234")):
+        handle_new_member(ctx)
+
+    sqs_repo.send_timeout_tasks.assert_called_once()
+    tasks = sqs_repo.send_timeout_tasks.call_args.args[0]
+    assert [(t["user_id"], t["verification_message_id"]) for t in tasks] == [(42, 100), (44, 101)]
+    stats_repo.increment_total_joins.assert_called_once_with(-100123, 2)
+
+
+def test_new_member_failure_does_not_skip_later_joiners():
+    """A failed challenge for one joiner is rolled back; the next joiner is still challenged."""
+    from unittest.mock import patch
+
+    from core.dispatcher import Context
+    from services.handlers.captcha import handle_new_member
+
+    update = {
+        "message": {
+            "message_id": 10,
+            "chat": {"id": -100123, "type": "supergroup"},
+            "from": {"id": 1, "first_name": "Adder", "language_code": "en"},
+            "new_chat_members": [{"id": 42, "first_name": "A"}, {"id": 44, "first_name": "B"}],
+        }
+    }
+    bot = MagicMock()
+    bot.send_photo.side_effect = _photo_sender({42: RuntimeError("photo failed"), 44: {"message_id": 101}})
+    bot.send_message.return_value = {"message_id": 999}
+    stats_repo, sqs_repo = MagicMock(), MagicMock()
+    ctx = Context(update, bot, stats_repo=stats_repo, sqs_repo=sqs_repo, captcha_repo=MagicMock())
+
+    with patch("services.captcha_image.generate_grid_captcha", return_value=(b"png", "1234")):
+        handle_new_member(ctx)
+
+    tasks = sqs_repo.send_timeout_tasks.call_args.args[0]
+    assert [t["user_id"] for t in tasks] == [44]
+    stats_repo.increment_total_joins.assert_called_once_with(-100123, 1)
+    bot.send_message.assert_called_once()  # single error notice for the update
+
+
+def test_send_timeout_tasks_chunks_by_ten():
+    """SQSClient.send_timeout_tasks splits into SendMessageBatch calls of at most 10 entries."""
+    from unittest.mock import patch
+
+    from services.repositories.sqs import SQSClient
+
+    client = MagicMock()
+    client.send_message_batch.return_value = {"Successful": [], "Failed": []}
+    tasks = [{"chat_id": -1, "user_id": i, "join_message_id": 1, "verification_message_id": 2} for i in range(12)]
+
+    with patch("services.repositories.sqs._get_sqs_client", return_value=client):
+        SQSClient().send_timeout_tasks(tasks, delay_seconds=300)
+
+    sizes = [len(c.kwargs["Entries"]) for c in client.send_message_batch.call_args_list]
+    assert sizes == [10, 2]
+    assert client.send_message_batch.call_args_list[0].kwargs["Entries"][0]["DelaySeconds"] == 300
@@ -31,6 +31,29 @@ def test_command_routing(mock_bot, mock_stats_repo, mock_sqs_repo, mock_vote_rep
     assert "help" not in handler_called
 
 
+def test_command_with_bot_mention_and_args(mock_bot, mock_stats_repo, mock_sqs_repo, mock_vote_repo):
+    """``/cmd@botname args`` should route to the ``/cmd`` handler."""
+    dp = Dispatcher(mock_bot, mock_stats_repo, mock_sqs_repo, mock_vote_repo)
+
+    handler_called = {}
+
+    @dp.command("wtf")
+    def handle_wtf(ctx):
+        handler_called["wtf"] = True
+
+    update = {
+        "message": {
+            "message_id": 1,
+            "from": {"id": 123, "first_name": "Test", "language_code": "en"},
+            "chat": {"id": -100123, "type": "supergroup"},
+            "text": "/wtf@zerde_bot\tsome term",
+        }
+    }
+
+    dp.process_update(update)
+    assert handler_called.get("wtf") is True
+
+
 def test_callback_query_routing(mock_bot, mock_stats_repo, mock_sqs_repo, mock_vote_repo):
     """Callback queries should route to callback handler with membership check."""
     dp = Dispatcher(mock_bot, mock_stats_repo, mock_sqs_repo, mock_vote_repo)
@@ -0,0 +1,67 @@
+"""Tests for the News Lambda's ElementTree feed parser."""
+
+import os
+import sys
+
+_zerde = os.path.join(os.path.dirname(__file__), "..", "src", "shared", "python")
+if _zerde not in sys.path:
+    sys.path.insert(0, _zerde)
+
+_news_dir = os.path.join(os.path.dirname(__file__), "..", "src", "news")
+_saved_modules: dict[str, object] = {}
+
+try:
+    for mod_name in list(sys.modules):
+        if mod_name in ("core", "services") or mod_name.startswith(("core.", "services.")):
+            _saved_modules[mod_name] = sys.modules.pop(mod_name)
+
+    sys.path.insert(0, _news_dir)
+    from services.news_fetcher import _parse_feed_xml  # noqa: E402
+finally:
+    if _news_dir in sys.path:
+        sys.path.remove(_news_dir)
+    for mod_name in list(sys.modules):
+        if mod_name in ("core", "services") or mod_name.startswith(("core.", "services.")):
+            sys.modules.pop(mod_name, None)
+    sys.modules.update(_saved_modules)
+
+
+_RSS_WITH_MEDIA_CONTENT = b"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0"
+     xmlns:content="http://purl.org/rss/1.0/modules/content/"
+     xmlns:media="http://search.yahoo.com/mrss/">
+  <channel>
+    <title>Example</title>
+    <item>
+      <title>Release notes</title>
+      <link>https://example.com/release</link>
+      <pubDate>Tue, 13 Oct 2026 08:00:00 GMT</pubDate>
+      <media:content url="https://example.com/cover.jpg" medium="image"/>
+      <content:encoded><![CDATA[<p>The real article body.</p>]]></content:encoded>
+    </item>
+  </channel>
+</rss>
+"""
+
+_ATOM_WITH_CONTENT = b"""<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+  <entry>
+    <title>Atom post</title>
+    <link href="https://example.com/atom"/>
+    <updated>2026-10-13T08:00:00Z</updated>
+    <content type="html">Atom body</content>
+  </entry>
+</feed>
+"""
+
+
+def test_media_content_does_not_hide_content_encoded():
+    [entry] = _parse_feed_xml(_RSS_WITH_MEDIA_CONTENT)
+    assert entry["summary"] == "<p>The real article body.</p>"
+    assert entry["link"] == "https://example.com/release"
+
+
+def test_atom_content_is_used_as_summary():
+    [entry] = _parse_feed_xml(_ATOM_WITH_CONTENT)
+    assert entry["summary"] == "Atom body"
+    assert entry["date"] == "2026-10-13T08:00:00Z"
@@ -100,14 +100,9 @@ class TestHandleQuizstats:
 
     def test_shows_stats_for_existing_user(self):
         quiz_repo = MagicMock()
-        quiz_repo.get_user_score.return_value = {
-            "total_score": 10,
-            "current_streak": 3,
-            "best_streak": 5,
-        }
         quiz_repo.get_leaderboard.return_value = [
             {"SK": "USER#111", "total_score": 20},
-            {"SK": "USER#456", "total_score": 10},
+            {"SK": "USER#456", "total_score": 10, "current_streak": 3, "best_streak": 5},
             {"SK": "USER#789", "total_score": 5},
         ]
         ctx = self._make_ctx(-100123, 456, quiz_repo)
@@ -128,10 +123,11 @@ class TestHandleQuizstats:
         assert "10</b> points" in call_text
         assert "3</b> days" in call_text
         assert "#2</b>" in call_text
+        quiz_repo.get_user_score.assert_not_called()
 
     def test_shows_no_data_for_new_user(self):
         quiz_repo = MagicMock()
-        quiz_repo.get_user_score.return_value = None
+        quiz_repo.get_leaderboard.return_value = [{"SK": "USER#111", "total_score": 20}]
         ctx = self._make_ctx(-100123, 456, quiz_repo)
 
         handle_quizstats(ctx)
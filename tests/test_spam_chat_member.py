@@ -0,0 +1,65 @@
+"""Tests for the cached chat-member and admin-list lookups."""
+
+from unittest.mock import MagicMock, patch
+
+from services.spam.chat_member import is_chat_admin_or_creator, resolve_target_mention
+
+
+def _bot_without_admin_list() -> MagicMock:
+    """Bot whose getChatAdministrators fails, so admin checks use the per-member lookup."""
+    bot = MagicMock()
+    bot.get_chat_administrators.side_effect = RuntimeError("not a group")
+    return bot
+
+
+def test_admin_status_cached_within_ttl() -> None:
+    bot = _bot_without_admin_list()
+    bot.get_chat_member.return_value = {"status": "administrator"}
+    assert is_chat_admin_or_creator(bot, -1001, 7) is True
+    assert is_chat_admin_or_creator(bot, -1001, 7) is True
+    bot.get_chat_member.assert_called_once_with(-1001, 7)
+
+
+def test_admin_status_refetched_after_ttl() -> None:
+    bot = _bot_without_admin_list()
+    bot.get_chat_member.side_effect = [{"status": "member"}, {"status": "administrator"}]
+    with patch("services.spam.chat_member.time.monotonic", side_effect=[0.0, 0.0, 1000.0, 1000.0]):
+        assert is_chat_admin_or_creator(bot, -1001, 7) is False
+        assert is_chat_admin_or_creator(bot, -1001, 7) is True
+    assert bot.get_chat_member.call_count == 2
+
+
+def test_api_error_not_cached() -> None:
+    bot = _bot_without_admin_list()
+    bot.get_chat_member.side_effect = [RuntimeError("boom"), {"status": "creator"}]
+    assert is_chat_admin_or_creator(bot, -1001, 7) is False
+    assert is_chat_admin_or_creator(bot, -1001, 7) is True
+
+
+def test_admin_check_and_target_mention_share_one_lookup() -> None:
+    bot = _bot_without_admin_list()
+    bot.get_chat_member.return_value = {"status": "member", "user": {"username": "spammer"}}
+    assert is_chat_admin_or_creator(bot, -1001, 7) is False
+    assert resolve_target_mention(bot, -1001, 7) == "@spammer"
+    bot.get_chat_member.assert_called_once_with(-1001, 7)
+
+
+def test_admin_list_answers_every_user_in_chat() -> None:
+    bot = MagicMock()
+    bot.get_chat_administrators.return_value = [
+        {"status": "creator", "user": {"id": 1}},
+        {"status": "administrator", "user": {"id": 2}},
+    ]
+    assert is_chat_admin_or_creator(bot, -1001, 1) is True
+    assert is_chat_admin_or_creator(bot, -1001, 2) is True
+    assert is_chat_admin_or_creator(bot, -1001, 7) is False
+    bot.get_chat_administrators.assert_called_once_with(-1001)
+    bot.get_chat_member.assert_not_called()
+
+
+def test_admin_list_error_falls_back_to_member_lookup() -> None:
+    bot = MagicMock()
+    bot.get_chat_administrators.side_effect = RuntimeError("boom")
+    bot.get_chat_member.return_value = {"status": "administrator"}
+    assert is_chat_admin_or_creator(bot, -1001, 7) is True
+    bot.get_chat_member.assert_called_once_with(-1001, 7)
@@ -0,0 +1,21 @@
+"""Tests for GroqSpamDetector verdict parsing."""
+
+import json
+
+import pytest
+from services.spam.groq_detector import _parse_verdict
+
+
+def test_parse_verdict_plain_json():
+    verdict = {"label": "SPAM", "confidence": 0.99, "reason": "job_offer"}
+    assert _parse_verdict(json.dumps(verdict)) == verdict
+
+
+def test_parse_verdict_strips_fences_and_prose():
+    content = 'Sure:\n```json\n{"label": "NOT_SPAM", "confidence": 0.97, "reason": "not_spam"}\n```'
+    assert _parse_verdict(content)["label"] == "NOT_SPAM"
+
+
+def test_parse_verdict_without_object_raises():
+    with pytest.raises(json.JSONDecodeError):
+        _parse_verdict("NOT_SPAM")
@@ -105,3 +105,22 @@ def test_handler_failure_reraises_for_sqs_retry() -> None:
     ):
         with pytest.raises(RuntimeError, match="boom"):
             process_sqs_event({"Records": [_record(body)]}, MagicMock(), MagicMock())
+
+
+def test_malformed_body_fails_batch_before_any_task_runs() -> None:
+    good = {
+        "task_type": "SPAM_CHECK",
+        "chat_id": -1001,
+        "user_id": 7,
+        "message_id": 8,
+        "text": "hello",
+        "triggered_rules": [],
+    }
+    records = [_record(good), {"messageId": "mid-2", "body": "{not json"}]
+    with (
+        patch("services.sqs_task_router.is_configured_group_chat", return_value=True),
+        patch("services.sqs_task_router.process_spam_check_task") as mock_ps,
+    ):
+        with pytest.raises(ValueError):
+            process_sqs_event({"Records": records}, MagicMock(), MagicMock())
+    mock_ps.assert_not_called()
@@ -0,0 +1,81 @@
+"""Tests for TelegramClient retry handling and background calls."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from services.telegram import TelegramAPIError, TelegramClient, drain_background
+
+
+def _resp(status: int, body: str, headers: dict | None = None) -> MagicMock:
+    resp = MagicMock()
+    resp.status = status
+    resp.data = body.encode("utf-8")
+    resp.headers = headers or {}
+    return resp
+
+
+def test_429_waits_retry_after_then_succeeds() -> None:
+    flood = _resp(429, '{"ok":false,"error_code":429,"parameters":{"retry_after":1}}')
+    ok = _resp(200, '{"ok":true,"result":{"message_id":7}}')
+    with (
+        patch("services.telegram.http") as http,
+        patch("services.telegram.time.sleep") as sleep,
+    ):
+        http.request.side_effect = [flood, ok]
+        result = TelegramClient().send_message(-100123, "hi")
+    assert result == {"message_id": 7}
+    sleep.assert_called_once_with(1.0)
+
+
+def test_long_flood_wait_is_not_slept_through() -> None:
+    flood = _resp(429, '{"ok":false,"error_code":429,"parameters":{"retry_after":30}}')
+    with (
+        patch("services.telegram.http") as http,
+        patch("services.telegram.time.sleep") as sleep,
+    ):
+        http.request.return_value = flood
+        with pytest.raises(TelegramAPIError):
+            TelegramClient()._post("sendMessage", {"chat_id": 1, "text": "x"})
+    assert http.request.call_count == 1
+    sleep.assert_not_called()
+
+
+def test_5xx_retried_until_attempts_run_out() -> None:
+    with (
+        patch("services.telegram.http") as http,
+        patch("services.telegram.time.sleep"),
+    ):
+        http.request.return_value = _resp(502, "Bad Gateway")
+        with pytest.raises(TelegramAPIError):
+            TelegramClient()._post("deleteMessage", {"chat_id": 1, "message_id": 2})
+    assert http.request.call_count == 3
+
+
+def test_5xx_not_retried_for_non_idempotent_send() -> None:
+    """A 502 may follow a delivered message; retrying sendMessage would post it twice."""
+    with (
+        patch("services.telegram.http") as http,
+        patch("services.telegram.time.sleep") as sleep,
+    ):
+        http.request.return_value = _resp(502, "Bad Gateway")
+        with pytest.raises(TelegramAPIError):
+            TelegramClient()._post("sendMessage", {"chat_id": 1, "text": "x"})
+    assert http.request.call_count == 1
+    sleep.assert_not_called()
+
+
+def test_4xx_not_retried() -> None:
+    with patch("services.telegram.http") as http:
+        http.request.return_value = _resp(400, '{"ok":false,"description":"Bad Request"}')
+        with pytest.raises(TelegramAPIError):
+            TelegramClient()._post("deleteMessage", {"chat_id": 1, "message_id": 2})
+    assert http.request.call_count == 1
+
+
+def test_answer_callback_query_async_is_sent_by_drain() -> None:
+    with patch("services.telegram.http") as http:
+        http.request.return_value = _resp(200, '{"ok":true,"result":true}')
+        TelegramClient().answer_callback_query_async("cb-1", text="ok")
+        drain_background()
+    assert http.request.call_count == 1
+    assert b'"callback_query_id":"cb-1"' in http.request.call_args.kwargs["body"]
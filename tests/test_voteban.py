@@ -0,0 +1,165 @@
+"""Tests for voteban: duplicate callbacks, duplicate sessions and racing deciding votes."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+
+def _make_vote_ctx(callback_query_id, vote_repo, bot, data=None):
+    from core.config import VOTEBAN_AGAINST_PREFIX
+    from core.dispatcher import Context
+
+    update = {
+        "callback_query": {
+            "id": callback_query_id,
+            "data": data or f"{VOTEBAN_AGAINST_PREFIX}42",
+            "from": {"id": 7, "first_name": "Voter", "language_code": "en"},
+            "message": {"message_id": 55, "chat": {"id": -100123, "type": "supergroup"}},
+        }
+    }
+    return Context(update, bot, vote_repo=vote_repo)
+
+
+def test_redelivered_callback_skips_add_vote(mock_bot):
+    from services.handlers.voteban import handle_vote_callback
+
+    vote_repo = MagicMock()
+    vote_repo.add_vote.return_value = {"votes_for": 1, "votes_against": 1, "already_voted": False, "session": {}}
+
+    handle_vote_callback(_make_vote_ctx("cb-1", vote_repo, mock_bot))
+    handle_vote_callback(_make_vote_ctx("cb-1", vote_repo, mock_bot))
+
+    vote_repo.add_vote.assert_called_once()
+    mock_bot.answer_callback_query.assert_not_called()  # no "already voted" alert for the redelivery
+
+
+def test_distinct_callbacks_each_recorded(mock_bot):
+    from services.handlers.voteban import handle_vote_callback
+
+    vote_repo = MagicMock()
+    vote_repo.add_vote.return_value = {"votes_for": 1, "votes_against": 1, "already_voted": False, "session": {}}
+
+    handle_vote_callback(_make_vote_ctx("cb-1", vote_repo, mock_bot))
+    handle_vote_callback(_make_vote_ctx("cb-2", vote_repo, mock_bot))
+
+    assert vote_repo.add_vote.call_count == 2
+
+
+def test_callback_that_failed_is_not_remembered(mock_bot):
+    from services.handlers.voteban import handle_vote_callback
+
+    vote_repo = MagicMock()
+    vote_repo.add_vote.return_value = {"votes_for": 1, "votes_against": 1, "already_voted": False, "session": {}}
+    mock_bot.answer_callback_query_async.side_effect = [RuntimeError("telegram down"), None]
+
+    with pytest.raises(RuntimeError):
+        handle_vote_callback(_make_vote_ctx("cb-1", vote_repo, mock_bot))
+    handle_vote_callback(_make_vote_ctx("cb-1", vote_repo, mock_bot))
+
+    assert vote_repo.add_vote.call_count == 2  # the redelivery is handled, not dropped as a duplicate
+    assert mock_bot.answer_callback_query_async.call_count == 2
+
+
+def test_second_voteban_does_not_replace_open_session(mock_bot):
+    from core.dispatcher import Context
+    from services.handlers.voteban import handle_voteban_command
+
+    vote_repo = MagicMock()
+    vote_repo.create_vote_session.return_value = False  # a live session already exists
+    update = {
+        "message": {
+            "message_id": 20,
+            "text": "/voteban",
+            "chat": {"id": -100123, "type": "supergroup"},
+            "from": {"id": 7, "first_name": "Voter", "language_code": "en"},
+            "reply_to_message": {"message_id": 19, "from": {"id": 42, "first_name": "Target"}},
+        }
+    }
+
+    handle_voteban_command(Context(update, mock_bot, vote_repo=vote_repo))
+
+    vote_repo.create_vote_session.assert_called_once()
+    edited = mock_bot.edit_message_text.call_args[0]
+    assert edited[1] == 999  # the duplicate vote message just sent
+    assert "already in progress" in edited[2]
+
+
+def test_voteban_on_admin_bot_is_refused(mock_bot):
+    """Bots never appear in getChatAdministrators, so the target is checked with getChatMember."""
+    from core.dispatcher import Context
+    from services.handlers.voteban import handle_voteban_command
+
+    vote_repo = MagicMock()
+    mock_bot.get_chat_administrators.return_value = [{"user": {"id": 1}, "status": "creator"}]
+    mock_bot.get_chat_member.return_value = {"status": "administrator", "user": {"id": 5, "is_bot": True}}
+    update = {
+        "message": {
+            "message_id": 20,
+            "text": "/voteban",
+            "chat": {"id": -100123, "type": "supergroup"},
+            "from": {"id": 7, "first_name": "Voter", "language_code": "en"},
+            "reply_to_message": {"message_id": 19, "from": {"id": 5, "is_bot": True, "first_name": "Bot"}},
+        }
+    }
+
+    handle_voteban_command(Context(update, mock_bot, vote_repo=vote_repo))
+
+    mock_bot.get_chat_member.assert_called_once_with(-100123, 5)
+    vote_repo.create_vote_session.assert_not_called()
+    assert "cannot vote to ban administrators" in mock_bot.send_message.call_args[0][1]
+
+
+def test_only_the_deciding_vote_finalizes(mock_bot):
+    from core.config import VOTEBAN_FOR_PREFIX, VOTEBAN_THRESHOLD
+    from services.handlers.voteban import handle_vote_callback
+
+    vote_repo = MagicMock()
+    vote_repo.add_vote.side_effect = [
+        {"votes_for": VOTEBAN_THRESHOLD, "votes_against": 0, "already_voted": False, "session": {}},
+        {"votes_for": VOTEBAN_THRESHOLD + 1, "votes_against": 0, "already_voted": False, "session": {}},
+    ]
+    vote_repo.claim_finalization.side_effect = [True, False]  # the racing vote finds the session claimed
+    for cb_id in ("cb-1", "cb-2"):
+        handle_vote_callback(_make_vote_ctx(cb_id, vote_repo, mock_bot, data=f"{VOTEBAN_FOR_PREFIX}42"))
+
+    mock_bot.kick_chat_member.assert_called_once_with(-100123, 42)
+    mock_bot.edit_message_text.assert_not_called()  # the racing vote doesn't re-render a closing session
+
+
+def test_vote_on_closed_session_is_answered_without_finalizing(mock_bot):
+    from core.config import VOTEBAN_FOR_PREFIX
+    from services.handlers.voteban import handle_vote_callback
+
+    vote_repo = MagicMock()
+    vote_repo.add_vote.return_value = {
+        "votes_for": 0,
+        "votes_against": 0,
+        "already_voted": False,
+        "session_closed": True,
+    }
+
+    handle_vote_callback(_make_vote_ctx("cb-1", vote_repo, mock_bot, data=f"{VOTEBAN_FOR_PREFIX}42"))
+
+    assert "already ended" in mock_bot.answer_callback_query.call_args.kwargs["text"]
+    mock_bot.kick_chat_member.assert_not_called()
+    mock_bot.edit_message_text.assert_not_called()
+
+
+def test_failed_finalize_is_retried_by_a_later_vote(mock_bot):
+    from core.config import VOTEBAN_FOR_PREFIX, VOTEBAN_THRESHOLD
+    from services.handlers.voteban import handle_vote_callback
+
+    vote_repo = MagicMock()
+    vote_repo.add_vote.side_effect = [
+        {"votes_for": VOTEBAN_THRESHOLD, "votes_against": 0, "already_voted": False, "session": {}},
+        {"votes_for": VOTEBAN_THRESHOLD + 1, "votes_against": 0, "already_voted": False, "session": {}},
+    ]
+    vote_repo.claim_finalization.return_value = True
+    mock_bot.kick_chat_member.side_effect = [RuntimeError("not enough rights"), None]
+
+    for cb_id in ("cb-1", "cb-2"):
+        handle_vote_callback(_make_vote_ctx(cb_id, vote_repo, mock_bot, data=f"{VOTEBAN_FOR_PREFIX}42"))
+
+    vote_repo.release_finalization.assert_called_once_with(-100123, 42)  # only the failed attempt
+    assert mock_bot.kick_chat_member.call_count == 2
+    vote_repo.delete_vote_session.assert_called_once_with(-100123, 42)
@@ -0,0 +1,151 @@
+"""Tests for VoteRepository request shapes against a stubbed DynamoDB client."""
+
+from botocore.stub import ANY, Stubber
+
+
+def _update_params(update_expression):
+    return {
+        "TableName": "test-stats-table",
+        "Key": {"stat_key": {"S": "voteban_-100123_42"}},
+        "UpdateExpression": update_expression,
+        "ConditionExpression": ANY,
+        "ExpressionAttributeNames": ANY,
+        "ExpressionAttributeValues": ANY,
+        "ReturnValues": "ALL_NEW",
+        "ReturnValuesOnConditionCheckFailure": "ALL_OLD",
+    }
+
+
+def test_vote_on_legacy_list_session_falls_back_to_list_append():
+    """ADD on an L-typed voter list is a ValidationException; the vote is retried as a list_append."""
+    from services.repositories._common import get_dynamodb_client
+    from services.repositories.votes import (
+        _ADD_VOTE_UPDATE_EXPRS,
+        _LEGACY_ADD_VOTE_UPDATE_EXPRS,
+        VoteRepository,
+    )
+
+    legacy_item = {
+        "votes_for": {"L": [{"N": "1"}, {"N": "7"}]},
+        "votes_against": {"L": []},
+        "target_first_name": {"S": "Target"},
+    }
+    with Stubber(get_dynamodb_client()) as stub:
+        stub.add_client_error(
+            "update_item",
+            "ValidationException",
+            expected_params=_update_params(_ADD_VOTE_UPDATE_EXPRS[True]),
+        )
+        stub.add_response(
+            "update_item",
+            {"Attributes": legacy_item},
+            expected_params=_update_params(_LEGACY_ADD_VOTE_UPDATE_EXPRS[True]),
+        )
+        result = VoteRepository().add_vote(-100123, 42, 7, True)
+        stub.assert_no_pending_responses()
+
+    assert result["votes_for"] == 2
+    assert result["already_voted"] is False
+    assert result["session"]["target_first_name"] == "Target"
+
+
+def test_vote_after_finalize_then_new_voteban():
+    """A late click on a deleted session is reported closed (nothing written) and /voteban can start again."""
+    from services.repositories._common import get_dynamodb_client, get_table
+    from services.repositories.votes import _ADD_VOTE_CONDITION, _ADD_VOTE_UPDATE_EXPRS, VoteRepository
+
+    assert _ADD_VOTE_CONDITION.startswith("attribute_exists(stat_key)")
+    repo = VoteRepository()
+    with (
+        Stubber(get_dynamodb_client()) as client_stub,
+        Stubber(get_table("test-stats-table").meta.client) as table_stub,
+    ):
+        # The session is gone, so the condition fails with no old item to return.
+        client_stub.add_client_error(
+            "update_item",
+            "ConditionalCheckFailedException",
+            expected_params=_update_params(_ADD_VOTE_UPDATE_EXPRS[True]),
+        )
+        table_stub.add_response(
+            "put_item",
+            {},
+            expected_params={
+                "TableName": "test-stats-table",
+                "Item": ANY,
+                "ConditionExpression": "attribute_not_exists(stat_key) OR attribute_not_exists(#ttl) OR #ttl < :now",
+                "ExpressionAttributeNames": {"#ttl": "ttl"},
+                "ExpressionAttributeValues": ANY,
+            },
+        )
+
+        late_vote = repo.add_vote(-100123, 42, 7, True)
+        created = repo.create_vote_session(-100123, 42, reply_message_id=19, sent_message_id=20, initiator_user_id=8)
+        client_stub.assert_no_pending_responses()
+        table_stub.assert_no_pending_responses()
+
+    assert late_vote["session_closed"] is True
+    assert late_vote["already_voted"] is False
+    assert created is True
+
+
+def test_finalization_claim_is_exclusive():
+    from services.repositories._common import get_table
+    from services.repositories.votes import VoteRepository
+
+    claim_params = {
+        "TableName": "test-stats-table",
+        "Key": {"stat_key": "voteban_-100123_42"},
+        "UpdateExpression": "SET finalized = :true",
+        "ConditionExpression": "attribute_exists(stat_key) AND attribute_not_exists(finalized)",
+        "ExpressionAttributeValues": {":true": True},
+    }
+    repo = VoteRepository()
+    with Stubber(get_table("test-stats-table").meta.client) as stub:
+        stub.add_response("update_item", {}, expected_params=claim_params)
+        stub.add_client_error("update_item", "ConditionalCheckFailedException", expected_params=claim_params)
+        assert repo.claim_finalization(-100123, 42) is True
+        assert repo.claim_finalization(-100123, 42) is False
+
+
+def test_deciding_vote_deletes_messages_with_json_ids(mock_bot):
+    """ALL_NEW numbers deserialize to Decimal; the session ids must reach deleteMessages as plain ints."""
+    from core.config import VOTEBAN_FOR_PREFIX, VOTEBAN_THRESHOLD
+    from core.dispatcher import Context
+    from services.handlers.voteban import handle_vote_callback
+    from services.repositories._common import get_dynamodb_client, get_table
+    from services.repositories.votes import _ADD_VOTE_UPDATE_EXPRS, VoteRepository
+    from zerde_common.json_utils import dumps_utf8
+
+    all_new = {
+        "stat_key": {"S": "voteban_-100123_42"},
+        "reply_message_id": {"N": "19"},
+        "sent_message_id": {"N": "20"},
+        "initiator_user_id": {"N": "8"},
+        "target_first_name": {"S": "Target"},
+        "votes_for": {"NS": [str(voter) for voter in range(1, VOTEBAN_THRESHOLD + 1)]},
+        "votes_for_info": {"L": [{"M": {"id": {"N": "7"}, "username": {"S": ""}, "first_name": {"S": "Voter"}}}]},
+    }
+    update = {
+        "callback_query": {
+            "id": "cb-1",
+            "data": f"{VOTEBAN_FOR_PREFIX}42",
+            "from": {"id": 7, "first_name": "Voter", "language_code": "en"},
+            "message": {"message_id": 20, "chat": {"id": -100123, "type": "supergroup"}},
+        }
+    }
+    with (
+        Stubber(get_dynamodb_client()) as client_stub,
+        Stubber(get_table("test-stats-table").meta.client) as table_stub,
+    ):
+        client_stub.add_response(
+            "update_item", {"Attributes": all_new}, expected_params=_update_params(_ADD_VOTE_UPDATE_EXPRS[True])
+        )
+        table_stub.add_response("update_item", {})  # claim_finalization
+        table_stub.add_response("delete_item", {})
+        handle_vote_callback(Context(update, mock_bot, vote_repo=VoteRepository()))
+        client_stub.assert_no_pending_responses()
+        table_stub.assert_no_pending_responses()
+
+    chat_id, message_ids = mock_bot.delete_messages_async.call_args[0]
+    assert message_ids == [20, 19]
+    dumps_utf8({"chat_id": chat_id, "message_ids": message_ids})  # Decimal would raise TypeError here
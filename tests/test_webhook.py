@@ -1,5 +1,6 @@
 """Tests for webhook event parsing and routing."""
 
+import base64
 import json
 
 from webhook import (
@@ -20,11 +21,21 @@ def test_verify_invalid_token():
     assert verify_webhook_secret_token(event) is False
 
 
+def test_verify_token_header_any_case():
+    event = {"headers": {"X-Telegram-Bot-Api-Secret-Token": "test-webhook-secret"}}
+    assert verify_webhook_secret_token(event) is True
+
+
 def test_verify_missing_token():
     event = {"headers": {}}
     assert verify_webhook_secret_token(event) is False
 
 
+def test_verify_non_ascii_token_rejected():
+    event = {"headers": {"x-telegram-bot-api-secret-token": "тест-токен"}}
+    assert verify_webhook_secret_token(event) is False
+
+
 def test_parse_json_body():
     body_dict = {"update_id": 123, "message": {"text": "/start"}}
     event = {"body": json.dumps(body_dict), "isBase64Encoded": False}
@@ -32,6 +43,13 @@ def test_parse_json_body():
     assert result["update_id"] == 123
 
 
+def test_parse_base64_body():
+    raw = json.dumps({"update_id": 7, "message": {"text": "сәлем"}}, ensure_ascii=False).encode("utf-8")
+    event = {"body": base64.b64encode(raw).decode("ascii"), "isBase64Encoded": True}
+    result = parse_api_gateway_event(event)
+    assert result["message"]["text"] == "сәлем"
+
+
 def test_is_relevant_command():
     body = {"message": {"text": "/start", "chat": {"id": 1}}}
     assert is_event_relevant_to_bot(body) is True
@@ -58,6 +76,11 @@ def test_is_relevant_document_only():
     assert is_event_relevant_to_bot(body) is True
 
 
+def test_not_relevant_blank_text():
+    body = {"message": {"text": " \n\t", "chat": {"id": 1}}}
+    assert is_event_relevant_to_bot(body) is False
+
+
 def test_create_response():
     resp = create_response(200, {"message": "ok"})
     assert resp["statusCode"] == 200